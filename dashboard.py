@@ -4,591 +4,424 @@ Enhanced Streamlit UI with wallet tracking, configurable thresholds, and multi-c
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
+import pyarrow as pa
+import requests
+from streamlit_autorefresh import st_autorefresh
 from datetime import datetime, timedelta
-import sqlite3
-import time
+from concurrent.futures import ThreadPoolExecutor
 import os
+import re
+import html
 import json
 
 # Import the monitor
 from polymarket_monitor import PolymarketMonitor, DetectionConfig, AlertChannel
 
-# Page configuration
-st.set_page_config(
-    page_title="Polymarket Sus Wallet Monitor",
-    page_icon="🎯",
-    layout="wide",
-    initial_sidebar_state="expanded"
+# Serialize Plotly figures with orjson (native numpy support) when installed
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+# Columns of suspicious_trades used by the dashboard
+TRADE_COLUMNS = (
+    'id', 'detected_at', 'wallet_address', 'wallet_age_days', 'market_id',
+    'market_question', 'market_category', 'outcome', 'bet_size', 'odds',
+    'alerted', 'risk_score', 'risk_level'
 )
 
-# Custom CSS for Cyber-Dark Enhanced UI
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600;700&family=Orbitron:wght@400;600;700;900&display=swap');
-
-    /* ============================================
-       CYBER-DARK THEME - Global Styles
-       ============================================ */
-    .stApp {
-        background: #0a0e27;
-        background-image:
-            radial-gradient(at 0% 0%, rgba(16, 185, 129, 0.05) 0px, transparent 50%),
-            radial-gradient(at 100% 0%, rgba(239, 68, 68, 0.05) 0px, transparent 50%),
-            radial-gradient(at 100% 100%, rgba(59, 130, 246, 0.05) 0px, transparent 50%);
-    }
-    
-    /* ============================================
-       TITLE & BRANDING
-       ============================================ */
-    .main-title {
-        font-family: 'Orbitron', sans-serif;
-        font-size: 2.5rem;
-        font-weight: 900;
-        background: linear-gradient(135deg, #10b981 0%, #3b82f6 50%, #ef4444 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        padding: 1rem 0;
-        margin-bottom: 0.5rem;
-        text-shadow: 0 0 40px rgba(16, 185, 129, 0.3);
-        letter-spacing: 2px;
-    }
+# Dashboard stylesheet, kept next to this file
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles.css")
 
-    .subtitle {
-        font-family: 'JetBrains Mono', monospace;
-        color: #64748b;
-        text-align: center;
-        font-size: 0.85rem;
-        margin-bottom: 1rem;
-        text-transform: uppercase;
-        letter-spacing: 3px;
-    }
+# Google Fonts loaded with <link> tags instead of a render-blocking CSS @import
+FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600;700'
+    '&family=Orbitron:wght@400;600;700;900&display=swap">'
+)
 
-    /* ============================================
-       METRIC CARDS - Cyber Style
-       ============================================ */
-    .metric-card {
-        background: linear-gradient(135deg, rgba(15, 23, 42, 0.8), rgba(30, 41, 59, 0.6));
-        border: 1px solid rgba(16, 185, 129, 0.2);
-        border-radius: 16px;
-        padding: 1.5rem;
-        backdrop-filter: blur(20px);
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
+# Rows per page in the live activity table
+LIVE_PAGE_SIZE = 25
+
+# Compact dtypes: float32 numerics, categoricals for low-cardinality strings
+TRADE_DTYPES = {
+    'bet_size': 'float32',
+    'odds': 'float32',
+    # float32 rather than a nullable int: unknown ages stay NaN for the numpy masks
+    'wallet_age_days': 'float32',
+    'risk_score': 'float32',
+    'outcome': 'category',
+    'market_category': 'category',
+    'wallet_address': 'category'
+}
+NUMERIC_COLUMNS = ['bet_size', 'odds', 'wallet_age_days', 'risk_score']
+
+# Entry-price chart buckets (5¢ wide)
+ODDS_BINS = 20
+
+# (market, price class, label) - static feed, rendered to HTML once at import
+TICKER_ITEMS = (
+    ("Politics", "price-up", "↑ $2.3M Vol"),
+    ("Crypto", "price-down", "↓ $1.8M Vol"),
+    ("Sports", "price-up", "↑ $945K Vol"),
+    ("Finance", "price-up", "↑ $1.2M Vol"),
+    ("Elections", "price-up", "↑ $5.7M Vol")
+)
+_ticker_items = (
+    '<div class="ticker-item"><span class="live-indicator"></span>'
+    '<span class="market-name">LIVE FEED</span></div>'
+    + "".join(
+        f'<div class="ticker-item"><span class="market-name">{name}</span> • '
+        f'<span class="{price_class}">{label}</span></div>'
+        for name, price_class, label in TICKER_ITEMS
+    )
+)
+# Items are repeated once for a seamless scroll loop
+TICKER_HTML = f'<div class="ticker-tape"><div class="ticker-content">{_ticker_items * 2}</div></div>'
 
-    .metric-card::after {
-        content: '';
-        position: absolute;
-        top: -50%;
-        right: -50%;
-        width: 200%;
-        height: 200%;
-        background: radial-gradient(circle, rgba(16, 185, 129, 0.1) 0%, transparent 70%);
-        opacity: 0;
-        transition: opacity 0.3s;
-    }
+# Main views, in display order
+VIEW_LABELS = (
+    "⚡ DASHBOARD",
+    "🔴 LIVE ACTIVITY",
+    "📍 WALLET TRACKER",
+    "🎯 MARKET TRACKER",
+    "➕ ADD WALLET",
+    "📊 STATISTICS"
+)
 
-    .metric-card:hover::after {
-        opacity: 1;
-    }
+# Shown until a monitor is initialized
+WELCOME_MD = """
+Configure your detection thresholds in the sidebar and click **Apply & Initialize Monitor** to begin.
 
-    .metric-card:hover {
-        border-color: #10b981;
-        box-shadow: 0 0 30px rgba(16, 185, 129, 0.3);
-        transform: translateY(-4px);
-    }
+**What this monitors:**
+- 🕐 **New wallets** - Accounts created recently (configurable)
+- 💰 **Large bets** - High-value positions ($10k+)
+- 📉 **Low odds bets** - Betting on unlikely outcomes
+"""
 
-    .metric-value {
-        font-family: 'Orbitron', monospace;
-        font-size: 2.2rem;
-        font-weight: 700;
-        color: #10b981;
-        text-shadow: 0 0 20px rgba(16, 185, 129, 0.5);
-    }
+# One card per whale trade; all cards are joined and sent in a single markdown call
+WHALE_CARD_TEMPLATE = (
+    '<div class="{alert_class}">'
+    '<div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap;">'
+    '<div style="flex: 1; min-width: 200px;">'
+    '<div style="font-size: 1.2rem; font-weight: 700; color: #ef4444; font-family: \'Orbitron\', monospace; '
+    'text-shadow: 0 0 15px rgba(239, 68, 68, 0.5);">${bet_size:,.0f}</div>'
+    '<div style="color: #94a3b8; font-size: 0.85rem; margin-top: 0.25rem;">{market_short}</div>'
+    '</div>'
+    '<div style="text-align: right;">'
+    '<span class="{outcome_badge}">{outcome}</span>'
+    '<div style="color: #64748b; font-size: 0.75rem; margin-top: 0.25rem; font-family: \'JetBrains Mono\', monospace;">'
+    '{wallet_short}</div>'
+    '</div>'
+    '</div>'
+    '</div>'
+)
 
-    .metric-value-red {
-        color: #ef4444;
-        text-shadow: 0 0 20px rgba(239, 68, 68, 0.5);
-    }
+# One metric card; the five cards are joined and sent in a single markdown call
+METRIC_CARD_TEMPLATE = (
+    '<div class="metric-card"><div class="metric-label">{label}</div>'
+    '<div class="metric-value{value_class}">{value}</div></div>'
+)
 
-    .metric-label {
-        font-family: 'JetBrains Mono', sans-serif;
-        font-size: 0.75rem;
-        color: #64748b;
-        text-transform: uppercase;
-        letter-spacing: 0.1em;
-    }
-    
-    /* Alert cards */
-    .alert-critical {
-        background: linear-gradient(135deg, rgba(239, 68, 68, 0.2), rgba(185, 28, 28, 0.1));
-        border-left: 4px solid #ef4444;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 0.5rem 0;
-    }
-    
-    .alert-warning {
-        background: linear-gradient(135deg, rgba(245, 158, 11, 0.2), rgba(180, 83, 9, 0.1));
-        border-left: 4px solid #f59e0b;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 0.5rem 0;
-    }
-    
-    .alert-info {
-        background: linear-gradient(135deg, rgba(59, 130, 246, 0.2), rgba(29, 78, 216, 0.1));
-        border-left: 4px solid #3b82f6;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 0.5rem 0;
-    }
-    
-    /* Wallet address styling */
-    .wallet-address {
-        font-family: 'JetBrains Mono', monospace;
-        background: rgba(15, 23, 42, 0.8);
-        color: #00d4ff;
-        padding: 0.5rem 1rem;
-        border-radius: 6px;
-        font-size: 0.85rem;
-        border: 1px solid rgba(0, 212, 255, 0.3);
-    }
-    
-    /* ============================================
-       POSITION BADGES - Neon YES/NO
-       ============================================ */
-    .badge-yes {
-        background: linear-gradient(135deg, #10b981, #059669);
-        color: white;
-        padding: 0.3rem 0.9rem;
-        border-radius: 20px;
-        font-family: 'Orbitron', monospace;
-        font-weight: 700;
-        font-size: 0.75rem;
-        box-shadow: 0 0 15px rgba(16, 185, 129, 0.4);
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
+# Page configuration
+st.set_page_config(
+    page_title="Polymarket Sus Wallet Monitor",
+    page_icon="🎯",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
 
-    .badge-no {
-        background: linear-gradient(135deg, #ef4444, #dc2626);
-        color: white;
-        padding: 0.3rem 0.9rem;
-        border-radius: 20px;
-        font-family: 'Orbitron', monospace;
-        font-weight: 700;
-        font-size: 0.75rem;
-        box-shadow: 0 0 15px rgba(239, 68, 68, 0.4);
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
+# Custom CSS for Cyber-Dark Enhanced UI (styles.css)
+@st.cache_data(show_spinner=False)
+def load_css(path=CSS_PATH):
+    """Read and minify the dashboard stylesheet once per process"""
+    with open(path, encoding="utf-8") as f:
+        css = f.read()
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)  # Comments
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,>])\s*', r'\1', css)
+    return css.replace(';}', '}').strip()
 
-    /* ============================================
-       SIDEBAR - Dark Cyber Theme
-       ============================================ */
-    section[data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #0f172a 0%, #0a0e27 100%);
-        border-right: 2px solid rgba(16, 185, 129, 0.2);
-        box-shadow: 4px 0 20px rgba(0, 0, 0, 0.5);
-    }
-    
-    section[data-testid="stSidebar"] .stMarkdown h1,
-    section[data-testid="stSidebar"] .stMarkdown h2,
-    section[data-testid="stSidebar"] .stMarkdown h3 {
-        color: #e2e8f0;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #7c3aed, #6366f1);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        font-family: 'Space Grotesk', sans-serif;
-        font-weight: 600;
-        padding: 0.5rem 1.5rem;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #8b5cf6, #818cf8);
-        box-shadow: 0 4px 15px rgba(124, 58, 237, 0.4);
-        transform: translateY(-2px);
-    }
-    
-    /* Primary button */
-    .stButton > button[kind="primary"] {
-        background: linear-gradient(135deg, #00d4ff, #0891b2);
-    }
-    
-    .stButton > button[kind="primary"]:hover {
-        background: linear-gradient(135deg, #22d3ee, #06b6d4);
-    }
-    
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-        background: rgba(30, 41, 59, 0.5);
-        padding: 0.5rem;
-        border-radius: 12px;
-    }
-    
-    .stTabs [data-baseweb="tab"] {
-        background: transparent;
-        color: #94a3b8;
-        border-radius: 8px;
-        font-family: 'Space Grotesk', sans-serif;
-    }
-    
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #7c3aed, #6366f1);
-        color: white;
-    }
-    
-    /* Input styling */
-    .stTextInput > div > div > input,
-    .stNumberInput > div > div > input {
-        background: rgba(30, 41, 59, 0.8);
-        border: 1px solid rgba(100, 116, 139, 0.3);
-        color: #f1f5f9;
-        font-family: 'JetBrains Mono', monospace;
-        border-radius: 8px;
-    }
-    
-    .stTextInput > div > div > input:focus,
-    .stNumberInput > div > div > input:focus {
-        border-color: #7c3aed;
-        box-shadow: 0 0 0 2px rgba(124, 58, 237, 0.2);
-    }
-    
-    /* Expander styling */
-    .streamlit-expanderHeader {
-        background: rgba(30, 41, 59, 0.6);
-        border-radius: 8px;
-        font-family: 'Space Grotesk', sans-serif;
-    }
-    
-    /* Data table */
-    .stDataFrame {
-        background: rgba(30, 41, 59, 0.5);
-        border-radius: 12px;
-        overflow: hidden;
-    }
-    
-    /* Divider */
-    hr {
-        border-color: rgba(100, 116, 139, 0.2);
-    }
 
-    /* Fix Streamlit info/alert boxes text color for dark theme */
-    .stAlert > div {
-        color: #f1f5f9 !important;
-    }
+# Re-emitted every run (Streamlit drops elements a rerun does not redraw),
+# but the file is only read once
+st.markdown(f"{FONT_LINKS}<style>{load_css()}</style>", unsafe_allow_html=True)
 
-    .stAlert p, .stAlert li, .stAlert span {
-        color: #f1f5f9 !important;
-    }
 
-    /* Make all text in main content area readable */
-    .stMarkdown, .stMarkdown p, .stMarkdown li, .stMarkdown span {
-        color: #e2e8f0;
-    }
+# ============================================================================
+# Session State Initialization
+# ============================================================================
 
-    /* Risk level indicators */
-    .risk-critical {
-        color: #ef4444;
-        font-weight: 700;
-    }
-    
-    .risk-high {
-        color: #f59e0b;
-        font-weight: 600;
-    }
-    
-    .risk-medium {
-        color: #eab308;
-    }
-    
-    /* ============================================
-       RESPONSIVE DESIGN - Mobile & Desktop
-       ============================================ */
-    @media (max-width: 768px) {
-        .main-title { font-size: 1.5rem !important; }
-        .metric-value { font-size: 1.5rem !important; }
-        .bento-grid { grid-template-columns: 1fr !important; }
-        .ticker-tape { font-size: 0.75rem !important; }
-    }
+# Defaults built once at import and applied with setdefault, so keys added in
+# later releases also reach sessions that are already running. setdefault
+# hands every session the same object, so DEFAULT_STATE may only hold
+# immutable values; per-session mutable values (category list, refresh clock,
+# pending test alerts) are set up once in the sentinel block.
+DEFAULT_STATE = {
+    'monitor': None,
+    'monitor_key': None,  # Connection settings the session's monitor was built with
+    'last_scan_time': None,
+    'scan_nonce': 0,  # Bumped by every scan; part of the data cache keys
+    'selected_wallet': None,
+    'auto_refresh_enabled': False,
+    'refresh_count': None,
+    'refresh_interval': 60,
+    'authenticated': False,
+    'current_user': None,
+    'auth_page': "login",  # "login" or "signup"
+    'tab2_page': 0
+}
+
+# Default categories similar to Polymarket
+DEFAULT_CATEGORIES = ("Politics", "Crypto", "Sports", "Finance")
+
+
+@st.cache_resource(show_spinner=False)
+def default_config():
+    """Default detection thresholds, constructed once per process"""
+    return DetectionConfig()
+
+
+for key, value in DEFAULT_STATE.items():
+    st.session_state.setdefault(key, value)
+
+if '_state_initialized' not in st.session_state:
+    st.session_state.config = default_config()
+    st.session_state.selected_categories = list(DEFAULT_CATEGORIES)
+    st.session_state.alert_tests = {}  # channel -> pending test-alert future
+    st.session_state.last_refresh_time = datetime.now()
+    st.session_state._state_initialized = True
 
-    /* ============================================
-       TICKER TAPE - Live Market Feed
-       ============================================ */
-    .ticker-tape {
-        background: linear-gradient(90deg, #0f172a 0%, #1e293b 50%, #0f172a 100%);
-        border-bottom: 1px solid #10b981;
-        padding: 0.5rem 0;
-        overflow: hidden;
-        position: relative;
-        box-shadow: 0 4px 10px rgba(16, 185, 129, 0.1);
-    }
 
-    .ticker-content {
-        display: flex;
-        animation: ticker-scroll 30s linear infinite;
-        font-family: 'JetBrains Mono', monospace;
-        font-size: 0.85rem;
-    }
+# ============================================================================
+# Data Loading
+# ============================================================================
 
-    .ticker-item {
-        padding: 0 2rem;
-        white-space: nowrap;
-        color: #94a3b8;
-    }
+@st.cache_resource(show_spinner=False)
+def get_monitor(db_path="polymarket_monitor.db"):
+    """Shared monitor for user auth, built once per process instead of per submit"""
+    return PolymarketMonitor(db_path=db_path, cache_size_mb=64)
+
+
+def get_session_monitor(db_path, telegram_token, telegram_chat_id, slack_webhook, api_key):
+    """
+    Per-session monitor, rebuilt only when its connection settings change.
+    Kept in session_state rather than st.cache_resource so users never share
+    alert credentials; the replaced monitor's connection is closed.
+    """
+    key = (db_path, telegram_token, telegram_chat_id, slack_webhook, api_key)
+    monitor = st.session_state.monitor
+    if monitor is not None and st.session_state.monitor_key == key:
+        return monitor
+
+    close_session_monitor()
+    st.session_state.monitor = PolymarketMonitor(
+        db_path=db_path,
+        telegram_token=telegram_token,
+        telegram_chat_id=telegram_chat_id,
+        slack_webhook_url=slack_webhook,
+        api_key=api_key
+    )
+    st.session_state.monitor_key = key
+    return st.session_state.monitor
 
-    .ticker-item .market-name {
-        color: #e2e8f0;
-        font-weight: 600;
-    }
 
-    .ticker-item .price-up {
-        color: #10b981;
-    }
+def close_session_monitor():
+    """Release the session's monitor and its SQLite handle"""
+    monitor = st.session_state.monitor
+    if monitor is not None:
+        monitor.close()
+    st.session_state.monitor = None
+    st.session_state.monitor_key = None
+
+
+@st.cache_resource(show_spinner=False)
+def get_alert_test_pool():
+    """Worker threads and a pooled HTTP session for the test-alert buttons"""
+    return ThreadPoolExecutor(max_workers=4), requests.Session()
+
+
+def submit_alert_test(channel, url, payload):
+    """Send a test alert off the script thread; show_alert_test_status reports back"""
+    executor, session = get_alert_test_pool()
+    st.session_state.alert_tests[channel] = executor.submit(session.post, url, json=payload, timeout=10)
+
+
+@st.fragment(run_every=1)
+def show_alert_test_status():
+    """Poll pending test alerts, then rerun the app once with their results"""
+    tests = st.session_state.alert_tests
+    if not all(future.done() for future in tests.values()):
+        st.caption("⏳ Sending test message...")
+        return
+
+    results = {}
+    for channel, future in tests.items():
+        try:
+            status = future.result().status_code
+            results[channel] = (True, "✓ Test message sent!") if status == 200 else (False, f"✗ Failed: {status}")
+        except Exception as e:
+            results[channel] = (False, f"✗ Error: {e}")
+    st.session_state.alert_test_results = results
+    st.session_state.alert_tests = {}
+    st.rerun()
 
-    .ticker-item .price-down {
-        color: #ef4444;
-    }
 
-    @keyframes ticker-scroll {
-        0% { transform: translateX(0); }
-        100% { transform: translateX(-50%); }
-    }
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def load_suspicious_df(_monitor, db_path, scan_nonce=0, limit=1000, min_bet_size=None, outcome=None, since=None, keywords=()):
+    """
+    Fetch suspicious trades (filters applied in SQL) and build the DataFrame.
+    Cached per filter set and scan_nonce so reruns skip the query and dtype
+    conversions until this session runs a new scan.
+    """
+    # Raw row tuples in TRADE_COLUMNS order; no per-row dicts to unpack
+    _, rows = _monitor.get_suspicious_trade_rows(
+        limit=limit,
+        min_bet_size=min_bet_size,
+        outcome=outcome,
+        since=since,
+        columns=TRADE_COLUMNS,
+        keywords=list(keywords)
+    )
+    if not rows:
+        return pd.DataFrame()
+
+    df = pd.DataFrame.from_records(rows, columns=TRADE_COLUMNS)
+    # Coerce numerics in one pass so a stray text value becomes NaN instead of raising
+    df[NUMERIC_COLUMNS] = df[NUMERIC_COLUMNS].apply(pd.to_numeric, errors='coerce')
+    df = df.astype(TRADE_DTYPES)
+    df['detected_at'] = pd.to_datetime(df['detected_at'], cache=True)
+    df['odds_cents'] = df['odds'].to_numpy() * 100  # Convert to cents for display
+
+    # Display strings built once with vectorized string ops
+    wallets = df['wallet_address'].astype(str)
+    df['wallet_short'] = wallets.str.slice(0, 10) + '...' + wallets.str.slice(-6)
+    questions = df['market_question'].fillna('')
+    df['market_short'] = questions.where(
+        questions.str.len() <= 60, questions.str.slice(0, 60) + '...'
+    )
 
-    /* ============================================
-       BENTO GRID - Modular Layout
-       ============================================ */
-    .bento-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-        gap: 1rem;
-        margin: 1rem 0;
-    }
+    # Lowercased text the category filter matches against
+    df['market_text'] = (questions + ' ' + df['market_category'].astype(str)).str.lower()
+    return df
 
-    .bento-card {
-        background: rgba(15, 23, 42, 0.6);
-        border: 1px solid rgba(100, 116, 139, 0.2);
-        border-radius: 16px;
-        padding: 1.5rem;
-        backdrop-filter: blur(20px);
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
 
-    .bento-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 2px;
-        background: linear-gradient(90deg, transparent, #10b981, transparent);
-        opacity: 0;
-        transition: opacity 0.3s;
-    }
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def load_dashboard_stats(_monitor, db_path, scan_nonce=0):
+    """
+    Aggregate dashboard stats, keyed on the session's scan_nonce so a new
+    scan invalidates them; the TTL picks up writes from the worker.
+    """
+    return _monitor.get_dashboard_stats()
 
-    .bento-card:hover::before {
-        opacity: 1;
-    }
 
-    .bento-card:hover {
-        border-color: #10b981;
-        box-shadow: 0 0 30px rgba(16, 185, 129, 0.15);
-        transform: translateY(-2px);
-    }
+@st.cache_data(ttl=60, show_spinner=False)
+def load_daily_counts(_monitor, db_path, scan_nonce=0, days=30, keywords=()):
+    """Per-day trade counts aggregated in SQL for the activity timeline"""
+    return _monitor.get_daily_counts(days=days, keywords=list(keywords))
 
-    /* ============================================
-       WHALE WATCHER - Large Trade Alerts
-       ============================================ */
-    .whale-alert {
-        background: linear-gradient(135deg, rgba(239, 68, 68, 0.15), rgba(185, 28, 28, 0.05));
-        border: 1px solid rgba(239, 68, 68, 0.3);
-        border-left: 4px solid #ef4444;
-        border-radius: 12px;
-        padding: 1rem;
-        margin: 0.75rem 0;
-        animation: pulse-red 2s ease-in-out infinite;
-    }
 
-    .whale-alert-mega {
-        background: linear-gradient(135deg, rgba(168, 85, 247, 0.15), rgba(124, 58, 237, 0.05));
-        border: 1px solid rgba(168, 85, 247, 0.3);
-        border-left: 4px solid #a855f7;
-        animation: pulse-purple 2s ease-in-out infinite;
-    }
+@st.cache_data(ttl=60, show_spinner=False)
+def load_odds_histogram(_monitor, db_path, scan_nonce=0, bins=ODDS_BINS, keywords=()):
+    """Entry-price bucket counts aggregated in SQL for the price chart"""
+    return _monitor.get_odds_histogram(bins=bins, keywords=list(keywords))
 
-    @keyframes pulse-red {
-        0%, 100% { box-shadow: 0 0 0 0 rgba(239, 68, 68, 0.4); }
-        50% { box-shadow: 0 0 20px 5px rgba(239, 68, 68, 0.2); }
-    }
 
-    @keyframes pulse-purple {
-        0%, 100% { box-shadow: 0 0 0 0 rgba(168, 85, 247, 0.4); }
-        50% { box-shadow: 0 0 20px 5px rgba(168, 85, 247, 0.2); }
-    }
+@st.cache_data(ttl=300, show_spinner=False)
+def load_wallet_stats(_monitor, db_path, wallet_address):
+    """Per-wallet trade stats, cached per address for the tracker tab"""
+    return _monitor.get_wallet_stats(wallet_address)
 
-    /* ============================================
-       CATEGORY PILLS - Compact Design
-       ============================================ */
-    .category-pill {
-        display: inline-block;
-        background: rgba(30, 41, 59, 0.6);
-        border: 1px solid rgba(100, 116, 139, 0.3);
-        padding: 0.5rem 1rem;
-        border-radius: 20px;
-        margin: 0.25rem;
-        font-family: 'JetBrains Mono', monospace;
-        font-size: 0.75rem;
-        color: #94a3b8;
-        transition: all 0.2s;
-        cursor: pointer;
-    }
 
-    .category-pill:hover {
-        border-color: #10b981;
-        color: #10b981;
-        box-shadow: 0 0 15px rgba(16, 185, 129, 0.2);
-    }
+@st.cache_data(ttl=30, show_spinner=False)
+def load_tracked_wallets(_monitor, db_path):
+    """Tracked wallets list; cleared whenever a wallet is added or removed"""
+    return _monitor.get_tracked_wallets()
 
-    .category-pill-active {
-        background: linear-gradient(135deg, #10b981, #059669);
-        border-color: #10b981;
-        color: white;
-        box-shadow: 0 0 15px rgba(16, 185, 129, 0.3);
-    }
 
-    /* ============================================
-       SPARKLINES - Mini Charts
-       ============================================ */
-    .sparkline-container {
-        height: 40px;
-        width: 100%;
-        position: relative;
+@st.cache_data(ttl=30, show_spinner=False)
+def load_tracked_markets(_monitor, db_path):
+    """
+    Tracked markets, their truncated selectbox labels and a label -> market id
+    lookup for the filters; cleared whenever a market is added or removed.
+    """
+    markets = _monitor.get_tracked_markets()
+    labels = tuple(
+        f"{m['question'][:40]}..." if len(m['question']) > 40 else m['question']
+        for m in markets
+    )
+    # Reversed so the first market wins when two questions truncate alike
+    ids_by_label = {
+        label: m['market_id'] for label, m in reversed(list(zip(labels, markets)))
     }
+    return markets, labels, ids_by_label
 
-    .sparkline {
-        stroke: #10b981;
-        stroke-width: 2;
-        fill: none;
-    }
 
-    .sparkline-down {
-        stroke: #ef4444;
-    }
+@st.cache_data(ttl=60, show_spinner=False)
+def load_active_events(_monitor, limit=100):
+    """Active Polymarket events for the Market Tracker; public data, shared by all sessions"""
+    return _monitor.api.get_events(active=True, limit=limit)
 
-    /* ============================================
-       LIVE UPDATE PULSE
-       ============================================ */
-    .live-pulse {
-        animation: pulse-glow 2s ease-in-out infinite;
-    }
 
-    @keyframes pulse-glow {
-        0%, 100% {
-            opacity: 1;
-            transform: scale(1);
-        }
-        50% {
-            opacity: 0.7;
-            transform: scale(1.02);
-        }
-    }
+@st.cache_data(ttl=30, show_spinner=False)
+def load_market_alert_counts(_monitor, db_path, market_ids, scan_nonce=0):
+    """Alert counts per tracked market, fetched with one grouped query"""
+    return _monitor.get_market_alert_counts(list(market_ids))
 
-    .live-indicator {
-        display: inline-block;
-        width: 8px;
-        height: 8px;
-        background: #10b981;
-        border-radius: 50%;
-        margin-right: 0.5rem;
-        animation: blink 1s ease-in-out infinite;
-    }
 
-    @keyframes blink {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.3; }
-    }
+def frame_key(df):
+    """Cheap fingerprint of a trades frame for keying derived caches"""
+    if df.empty:
+        return (0, None, 0)
+    return (len(df), df['detected_at'].max(), int(df['id'].sum()))
 
-    /* ============================================
-       SCROLLBAR STYLING
-       ============================================ */
-    ::-webkit-scrollbar {
-        width: 8px;
-        height: 8px;
-    }
 
-    ::-webkit-scrollbar-track {
-        background: rgba(15, 23, 42, 0.5);
+@st.cache_data(max_entries=32, show_spinner=False)
+def summarize_trades(key, _df):
+    """Bet/price summary stats, cached on frame_key(df)"""
+    return {
+        'bet_mean': float(_df['bet_size'].mean()),
+        'bet_median': float(_df['bet_size'].median()),
+        'bet_max': float(_df['bet_size'].max()),
+        'bet_total': float(_df['bet_size'].sum()),
+        'odds_mean': float(_df['odds_cents'].mean()),
+        'odds_median': float(_df['odds_cents'].median()),
+        'odds_min': float(_df['odds_cents'].min()),
+        'odds_max': float(_df['odds_cents'].max())
     }
-    
-    ::-webkit-scrollbar-thumb {
-        background: #475569;
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: #64748b;
-    }
-</style>
-""", unsafe_allow_html=True)
 
 
 # ============================================================================
-# Session State Initialization
+# Authentication Gate
 # ============================================================================
 
-if 'monitor' not in st.session_state:
-    st.session_state.monitor = None
-if 'last_scan_time' not in st.session_state:
-    st.session_state.last_scan_time = None
-if 'selected_wallet' not in st.session_state:
-    st.session_state.selected_wallet = None
-if 'config' not in st.session_state:
-    st.session_state.config = DetectionConfig()
-if 'selected_categories' not in st.session_state:
-    # Default categories similar to Polymarket
-    st.session_state.selected_categories = ["Politics", "Crypto", "Sports", "Finance"]
-if 'auto_refresh_enabled' not in st.session_state:
-    st.session_state.auto_refresh_enabled = False
-if 'last_refresh_time' not in st.session_state:
-    st.session_state.last_refresh_time = datetime.now()
-if 'refresh_interval' not in st.session_state:
-    st.session_state.refresh_interval = 60
-if 'authenticated' not in st.session_state:
-    st.session_state.authenticated = False
-if 'current_user' not in st.session_state:
-    st.session_state.current_user = None
-if 'auth_page' not in st.session_state:
-    st.session_state.auth_page = "login"  # "login" or "signup"
+def show_flash_message():
+    """Show (once) a success message queued before the last st.rerun()"""
+    message = st.session_state.pop('flash_message', None)
+    if message:
+        st.success(message)
 
 
-# ============================================================================
-# Authentication Gate
-# ============================================================================
-
+@st.fragment
 def show_login_page():
-    """Display login form"""
-    st.markdown('<h1 class="main-title">🎯 Polymarket Sus Wallet Monitor</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Please login to continue</p>', unsafe_allow_html=True)
+    """Display login form; failed submits rerun only this fragment"""
+    st.markdown(
+        '<h1 class="main-title">🎯 Polymarket Sus Wallet Monitor</h1>'
+        '<p class="subtitle">Please login to continue</p>',
+        unsafe_allow_html=True
+    )
 
     col1, col2, col3 = st.columns([1, 2, 1])
 
     with col2:
+        show_flash_message()
         st.markdown("### 🔐 Login")
 
         with st.form("login_form"):
@@ -600,15 +433,12 @@ def show_login_page():
                 if not username or not password:
                     st.error("Please enter both username and password")
                 else:
-                    # Initialize temporary monitor just for authentication
-                    temp_monitor = PolymarketMonitor(db_path="polymarket_monitor.db")
-                    success, user_data = temp_monitor.authenticate_user(username, password)
+                    success, user_data = get_monitor().authenticate_user(username, password)
 
                     if success:
                         st.session_state.authenticated = True
                         st.session_state.current_user = user_data
-                        st.success(f"Welcome back, {user_data['username']}!")
-                        time.sleep(0.5)
+                        st.session_state.flash_message = f"Welcome back, {user_data['username']}!"
                         st.rerun()
                     else:
                         st.error("Invalid username or password")
@@ -624,10 +454,14 @@ def show_login_page():
                 st.rerun()
 
 
+@st.fragment
 def show_signup_page():
-    """Display signup form"""
-    st.markdown('<h1 class="main-title">🎯 Polymarket Sus Wallet Monitor</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Create your account</p>', unsafe_allow_html=True)
+    """Display signup form; failed submits rerun only this fragment"""
+    st.markdown(
+        '<h1 class="main-title">🎯 Polymarket Sus Wallet Monitor</h1>'
+        '<p class="subtitle">Create your account</p>',
+        unsafe_allow_html=True
+    )
 
     col1, col2, col3 = st.columns([1, 2, 1])
 
@@ -647,14 +481,10 @@ def show_signup_page():
                 elif password != password_confirm:
                     st.error("Passwords do not match")
                 else:
-                    # Initialize temporary monitor just for user creation
-                    temp_monitor = PolymarketMonitor(db_path="polymarket_monitor.db")
-                    success, message = temp_monitor.create_user(username, email, password)
+                    success, message = get_monitor().create_user(username, email, password)
 
                     if success:
-                        st.success(message)
-                        st.info("Please login with your new account")
-                        time.sleep(1)
+                        st.session_state.flash_message = f"{message} Please login with your new account."
                         st.session_state.auth_page = "login"
                         st.rerun()
                     else:
@@ -679,6 +509,8 @@ if not st.session_state.authenticated:
         show_signup_page()
     st.stop()
 
+show_flash_message()
+
 
 # ============================================================================
 # Sidebar Configuration
@@ -692,72 +524,63 @@ with st.sidebar:
     if st.button("🚪 Logout", use_container_width=True):
         st.session_state.authenticated = False
         st.session_state.current_user = None
-        st.session_state.monitor = None
-        st.success("Logged out successfully")
-        time.sleep(0.5)
+        close_session_monitor()
+        st.session_state.flash_message = "Logged out successfully"
         st.rerun()
 
     st.divider()
 
-    st.markdown("### ⚙️ Configuration")
-    
-    # Database path
-    db_path = st.text_input(
-        "Database Path",
-        value="polymarket_monitor.db",
-        help="SQLite database file path"
-    )
-    
-    st.divider()
-    
-    # -------------------------------------------------------------------------
-    # API Configuration
-    # -------------------------------------------------------------------------
-    st.markdown("### 🔑 API Keys")
-    
-    with st.expander("Polymarket Builder API", expanded=False):
-        api_key_enabled = st.checkbox(
-            "Use Builder API Key",
-            value=False,
-            help="Higher rate limits with authenticated requests"
+    # All configuration widgets live in one form, so editing them does not
+    # rerun the dashboard until the form is submitted
+    with st.form("config_form", clear_on_submit=False, border=False):
+        st.markdown("### ⚙️ Configuration")
+        
+        # Database path
+        db_path = st.text_input(
+            "Database Path",
+            value="polymarket_monitor.db",
+            help="SQLite database file path"
         )
         
-        if api_key_enabled:
+        st.divider()
+        
+        # ---------------------------------------------------------------------
+        # API Configuration
+        # ---------------------------------------------------------------------
+        st.markdown("### 🔑 API Keys")
+        
+        with st.expander("Polymarket Builder API", expanded=False):
+            api_key_enabled = st.checkbox(
+                "Use Builder API Key",
+                value=False,
+                help="Higher rate limits with authenticated requests"
+            )
             api_key = st.text_input(
                 "API Key",
                 type="password",
                 help="Get from Polymarket Builder dashboard"
             )
-            if api_key:
-                st.success("✓ API key set")
-        else:
-            api_key = None
-    
-    st.divider()
-    
-    # -------------------------------------------------------------------------
-    # Detection Thresholds - THE KEY PART
-    # -------------------------------------------------------------------------
-    st.markdown("### 🎯 Detection Thresholds")
-    
-    st.markdown("##### 👛 Wallet Age")
-    wallet_age_enabled = st.checkbox("Enable wallet age check", value=True)
-    if wallet_age_enabled:
-        wallet_age_days = st.slider(
+        
+        st.divider()
+        
+        # ---------------------------------------------------------------------
+        # Detection Thresholds - THE KEY PART
+        # ---------------------------------------------------------------------
+        st.markdown("### 🎯 Detection Thresholds")
+        
+        st.markdown("##### 👛 Wallet Age")
+        wallet_age_enabled = st.checkbox("Enable wallet age check", value=True)
+        wallet_age_input = st.slider(
             "Max wallet age (days)",
             min_value=1,
             max_value=90,
             value=14,
             help="Flag wallets created within this many days"
         )
-        st.caption(f"🔍 Wallets < {wallet_age_days} days old will be flagged")
-    else:
-        wallet_age_days = 999999
-    
-    st.markdown("##### 💰 Bet Size")
-    bet_size_enabled = st.checkbox("Enable bet size check", value=True)
-    if bet_size_enabled:
-        min_bet_size = st.number_input(
+        
+        st.markdown("##### 💰 Bet Size")
+        bet_size_enabled = st.checkbox("Enable bet size check", value=True)
+        min_bet_input = st.number_input(
             "Minimum bet size (USD)",
             min_value=100,
             max_value=1000000,
@@ -765,13 +588,9 @@ with st.sidebar:
             step=1000,
             help="Only flag bets above this amount"
         )
-        st.caption(f"🔍 Bets ≥ ${min_bet_size:,} will be analyzed")
-    else:
-        min_bet_size = 0
-    
-    st.markdown("##### 📉 Entry Price (Odds)")
-    odds_enabled = st.checkbox("Enable low odds check", value=True)
-    if odds_enabled:
+        
+        st.markdown("##### 📉 Entry Price (Odds)")
+        odds_enabled = st.checkbox("Enable low odds check", value=True)
         max_odds_cents = st.slider(
             "Max entry price (cents)",
             min_value=1,
@@ -779,22 +598,16 @@ with st.sidebar:
             value=10,
             help="Flag bets where entry price is below this (e.g., 5 = 5 cents on the dollar)"
         )
-        max_odds = max_odds_cents / 100
-        st.caption(f"🔍 Bets at ≤ {max_odds_cents}¢ on the dollar will be flagged")
-    else:
-        max_odds = 1.0
-    
-    st.divider()
-    
-    # -------------------------------------------------------------------------
-    # Alert Configuration
-    # -------------------------------------------------------------------------
-    st.markdown("### 📣 Alerts")
-    
-    with st.expander("Telegram", expanded=False):
-        telegram_enabled = st.checkbox("Enable Telegram alerts", value=False)
         
-        if telegram_enabled:
+        st.divider()
+        
+        # ---------------------------------------------------------------------
+        # Alert Configuration
+        # ---------------------------------------------------------------------
+        st.markdown("### 📣 Alerts")
+        
+        with st.expander("Telegram", expanded=False):
+            telegram_enabled = st.checkbox("Enable Telegram alerts", value=False)
             telegram_token = st.text_input(
                 "Bot Token",
                 type="password",
@@ -804,61 +617,34 @@ with st.sidebar:
                 "Chat ID",
                 help="Your Telegram chat/channel ID"
             )
-            
-            if telegram_token and telegram_chat_id:
-                if st.button("🧪 Test Telegram"):
-                    try:
-                        import requests
-                        url = f"https://api.telegram.org/bot{telegram_token}/sendMessage"
-                        payload = {
-                            "chat_id": telegram_chat_id,
-                            "text": "✅ Polymarket Monitor connected successfully!"
-                        }
-                        response = requests.post(url, json=payload, timeout=10)
-                        if response.status_code == 200:
-                            st.success("✓ Test message sent!")
-                        else:
-                            st.error(f"✗ Failed: {response.status_code}")
-                    except Exception as e:
-                        st.error(f"✗ Error: {e}")
-        else:
-            telegram_token = None
-            telegram_chat_id = None
-    
-    with st.expander("Slack", expanded=False):
-        slack_enabled = st.checkbox("Enable Slack alerts", value=False)
         
-        if slack_enabled:
+        with st.expander("Slack", expanded=False):
+            slack_enabled = st.checkbox("Enable Slack alerts", value=False)
             slack_webhook = st.text_input(
                 "Webhook URL",
                 type="password",
                 help="Slack incoming webhook URL"
             )
-            
-            if slack_webhook:
-                if st.button("🧪 Test Slack"):
-                    try:
-                        import requests
-                        response = requests.post(
-                            slack_webhook,
-                            json={"text": "✅ Polymarket Monitor connected!"},
-                            timeout=10
-                        )
-                        if response.status_code == 200:
-                            st.success("✓ Test message sent!")
-                        else:
-                            st.error(f"✗ Failed: {response.status_code}")
-                    except Exception as e:
-                        st.error(f"✗ Error: {e}")
-        else:
-            slack_webhook = None
-    
-    st.divider()
-    
-    # -------------------------------------------------------------------------
-    # Initialize Monitor
-    # -------------------------------------------------------------------------
-    if st.button("🚀 Initialize Monitor", type="primary", use_container_width=True):
+        
+        # ---------------------------------------------------------------------
+        # Initialize Monitor
+        # ---------------------------------------------------------------------
+        submitted = st.form_submit_button(
+            "🚀 Apply & Initialize Monitor",
+            type="primary",
+            use_container_width=True
+        )
+
+    # Effective settings from the last submitted form values
+    api_key = api_key if api_key_enabled and api_key else None
+    wallet_age_days = wallet_age_input if wallet_age_enabled else 999999
+    min_bet_size = min_bet_input if bet_size_enabled else 0
+    max_odds = max_odds_cents / 100 if odds_enabled else 1.0
+    telegram_token = telegram_token if telegram_enabled else None
+    telegram_chat_id = telegram_chat_id if telegram_enabled else None
+    slack_webhook = slack_webhook if slack_enabled else None
+
+    if submitted:
         config = DetectionConfig(
             wallet_age_days=wallet_age_days,
             min_bet_size=min_bet_size,
@@ -868,17 +654,47 @@ with st.sidebar:
             check_odds=odds_enabled
         )
         
-        st.session_state.monitor = PolymarketMonitor(
-            db_path=db_path,
-            telegram_token=telegram_token if telegram_enabled else None,
-            telegram_chat_id=telegram_chat_id if telegram_enabled else None,
-            slack_webhook_url=slack_webhook if slack_enabled else None,
-            api_key=api_key if api_key_enabled else None,
-            config=config
+        monitor = get_session_monitor(
+            db_path, telegram_token, telegram_chat_id, slack_webhook, api_key
         )
+        monitor.config = config
         st.session_state.config = config
-        st.success("✓ Monitor initialized!")
+        st.session_state.flash_message = "✓ Monitor initialized!"
         st.rerun()
+
+    # Test buttons can't live inside a form; they use the last applied values.
+    # Sends run on a worker thread so the sidebar stays responsive meanwhile
+    if (telegram_token and telegram_chat_id) or slack_webhook:
+        test_results = st.session_state.pop('alert_test_results', {})
+        col_tg, col_slack = st.columns(2)
+        with col_tg:
+            if telegram_token and telegram_chat_id and st.button("🧪 Test Telegram", use_container_width=True):
+                submit_alert_test(
+                    'telegram',
+                    f"https://api.telegram.org/bot{telegram_token}/sendMessage",
+                    {
+                        "chat_id": telegram_chat_id,
+                        "text": "✅ Polymarket Monitor connected successfully!"
+                    }
+                )
+        with col_slack:
+            if slack_webhook and st.button("🧪 Test Slack", use_container_width=True):
+                submit_alert_test(
+                    'slack',
+                    slack_webhook,
+                    {"text": "✅ Polymarket Monitor connected!"}
+                )
+
+        for channel, col in (('telegram', col_tg), ('slack', col_slack)):
+            if channel in test_results:
+                ok, message = test_results[channel]
+                if ok:
+                    col.success(message)
+                else:
+                    col.error(message)
+
+        if st.session_state.alert_tests:
+            show_alert_test_status()
     
     st.divider()
     
@@ -918,9 +734,18 @@ with st.sidebar:
                 else:
                     stats = st.session_state.monitor.scan_tracked_wallets()
 
+                found = stats.get('suspicious_found', 0)
                 st.session_state.last_scan_time = datetime.now()
-                st.success(f"✓ Found {stats.get('suspicious_found', 0)} suspicious")
-                st.rerun()
+
+                # Only a scan that saved new trades invalidates the data and
+                # needs the page re-rendered; otherwise report in place
+                if found:
+                    load_suspicious_df.clear()
+                    load_wallet_stats.clear()
+                    st.session_state.scan_nonce += 1
+                    st.session_state.flash_message = f"✓ Found {found} suspicious"
+                    st.rerun()
+                st.success("✓ Found 0 suspicious")
         else:
             st.warning("Initialize monitor first")
     
@@ -940,8 +765,8 @@ with st.sidebar:
         filters_active.append(f"📉 Price ≤ {max_odds_cents}¢")
     
     if filters_active:
-        for f in filters_active:
-            st.caption(f"✓ {f}")
+        # One caption element for all active filters
+        st.caption("  \n".join(f"✓ {f}" for f in filters_active))
     else:
         st.caption("No filters active")
 
@@ -974,13 +799,12 @@ with st.sidebar:
 
     # Get tracked markets for filtering
     if 'monitor' in st.session_state and st.session_state.monitor:
-        tracked_markets = st.session_state.monitor.get_tracked_markets()
+        tracked_markets, market_labels, _ = load_tracked_markets(
+            st.session_state.monitor, st.session_state.monitor.db_path
+        )
 
         if tracked_markets:
-            market_options = ["All Markets"] + [
-                f"{m['question'][:40]}..." if len(m['question']) > 40 else m['question']
-                for m in tracked_markets
-            ]
+            market_options = ("All Markets",) + market_labels
             selected_market = st.selectbox(
                 "Filter by market",
                 market_options,
@@ -1002,95 +826,41 @@ with st.sidebar:
 # ============================================================================
 # TICKER TAPE - Live Market Feed
 # ============================================================================
-st.markdown('''
-<div class="ticker-tape">
-    <div class="ticker-content">
-        <div class="ticker-item">
-            <span class="live-indicator"></span>
-            <span class="market-name">LIVE FEED</span>
-        </div>
-        <div class="ticker-item">
-            <span class="market-name">Politics</span> •
-            <span class="price-up">↑ $2.3M Vol</span>
-        </div>
-        <div class="ticker-item">
-            <span class="market-name">Crypto</span> •
-            <span class="price-down">↓ $1.8M Vol</span>
-        </div>
-        <div class="ticker-item">
-            <span class="market-name">Sports</span> •
-            <span class="price-up">↑ $945K Vol</span>
-        </div>
-        <div class="ticker-item">
-            <span class="market-name">Finance</span> •
-            <span class="price-up">↑ $1.2M Vol</span>
-        </div>
-        <div class="ticker-item">
-            <span class="market-name">Elections</span> •
-            <span class="price-up">↑ $5.7M Vol</span>
-        </div>
-        <!-- Duplicate for seamless scroll -->
-        <div class="ticker-item">
-            <span class="live-indicator"></span>
-            <span class="market-name">LIVE FEED</span>
-        </div>
-        <div class="ticker-item">
-            <span class="market-name">Politics</span> •
-            <span class="price-up">↑ $2.3M Vol</span>
-        </div>
-        <div class="ticker-item">
-            <span class="market-name">Crypto</span> •
-            <span class="price-down">↓ $1.8M Vol</span>
-        </div>
-        <div class="ticker-item">
-            <span class="market-name">Sports</span> •
-            <span class="price-up">↑ $945K Vol</span>
-        </div>
-        <div class="ticker-item">
-            <span class="market-name">Finance</span> •
-            <span class="price-up">↑ $1.2M Vol</span>
-        </div>
-        <div class="ticker-item">
-            <span class="market-name">Elections</span> •
-            <span class="price-up">↑ $5.7M Vol</span>
-        </div>
-    </div>
-</div>
-''', unsafe_allow_html=True)
+st.markdown(TICKER_HTML, unsafe_allow_html=True)
 
 # Header
-st.markdown('<h1 class="main-title">⚡ WHALE WATCHER</h1>', unsafe_allow_html=True)
-st.markdown('<p class="subtitle">Suspicious Activity Detection System</p>', unsafe_allow_html=True)
+st.markdown(
+    '<h1 class="main-title">⚡ WHALE WATCHER</h1>'
+    '<p class="subtitle">Suspicious Activity Detection System</p>',
+    unsafe_allow_html=True
+)
 
 # ============================================================================
 # Auto-Refresh Logic
 # ============================================================================
-if st.session_state.auto_refresh_enabled:
-    # Check how much time has passed since last refresh
+@st.fragment(run_every=1)
+def show_refresh_countdown():
+    """Tick the next-refresh caption every second without rerunning the page"""
     time_since_refresh = (datetime.now() - st.session_state.last_refresh_time).total_seconds()
+    time_remaining = max(0, st.session_state.refresh_interval - int(time_since_refresh))
+    st.caption(f"🔄 Next refresh in {time_remaining}s")
 
-    # Get refresh interval from session state
-    refresh_interval = st.session_state.refresh_interval
-
-    # Show countdown timer
-    time_remaining = max(0, refresh_interval - int(time_since_refresh))
 
-    if time_remaining > 0:
-        # Display countdown
-        col1, col2, col3 = st.columns([2, 1, 2])
-        with col2:
-            st.caption(f"🔄 Next refresh in {time_remaining}s")
+if st.session_state.auto_refresh_enabled:
+    # Browser-side timer triggers the full rerun, so the server thread is free
+    # between ticks instead of sleeping in a rerun loop
+    refresh_count = st_autorefresh(
+        interval=st.session_state.refresh_interval * 1000,
+        key="auto_refresh"
+    )
 
-    # Trigger refresh if interval has passed
-    if time_since_refresh >= refresh_interval:
+    if refresh_count != st.session_state.refresh_count:
+        st.session_state.refresh_count = refresh_count
         st.session_state.last_refresh_time = datetime.now()
-        time.sleep(0.1)  # Small delay to ensure UI updates
-        st.rerun()
 
-    # Use st.empty() to create a placeholder that will trigger rerun
-    # This makes the countdown actually count down
-    time.sleep(1)
-    st.rerun()
+    col1, col2, col3 = st.columns([2, 1, 2])
+    with col2:
+        show_refresh_countdown()
 
 # ============================================================================
 # Category Selection (Polymarket-style) - Always visible
@@ -1101,35 +871,148 @@ if st.session_state.auto_refresh_enabled:
 # ============================================================================
 
 # All available Polymarket categories
-ALL_CATEGORIES = [
+ALL_CATEGORIES = (
     "Politics", "Crypto", "Sports", "Finance", "Geopolitics",
     "Earnings", "Tech", "Culture", "World", "Economy",
     "Climate & Science", "Elections", "AI", "Business", "Pop Culture"
-]
+)
+
+# Risk level labels for the live activity table
+RISK_LABELS = {
+    "CRITICAL": "🔴 CRITICAL",
+    "HIGH": "🟠 HIGH",
+    "MEDIUM": "🟡 MEDIUM",
+    "LOW": "🟢 LOW"
+}
+
+# Keywords used to match trades to categories by market text
+CATEGORY_KEYWORDS = {
+    "Politics": ("trump", "biden", "election", "president", "senate", "congress", "politics", "vote", "poll"),
+    "Sports": ("nfl", "nba", "mlb", "nhl", "soccer", "football", "basketball", "baseball", "sports", "game", "playoff"),
+    "Crypto": ("bitcoin", "crypto", "btc", "eth", "ethereum", "blockchain", "defi", "nft"),
+    "Finance": ("stock", "market", "fed", "interest", "economy", "dow", "s&p", "nasdaq", "trading"),
+    "Tech": ("tech", "apple", "google", "amazon", "microsoft", "ai", "software"),
+    "Culture": ("culture", "music", "movie", "celebrity", "entertainment"),
+    "Pop Culture": ("pop", "celebrity", "kardashian", "taylor", "beyonce"),
+    "Geopolitics": ("china", "russia", "ukraine", "war", "nato", "conflict", "israel", "gaza"),
+    "World": ("global", "international", "world", "country"),
+    "Economy": ("gdp", "inflation", "recession", "unemployment", "economic"),
+    "Climate & Science": ("climate", "science", "weather", "temperature", "carbon", "research"),
+    "Elections": ("election", "vote", "ballot", "primary", "caucus"),
+    "AI": ("ai", "artificial intelligence", "chatgpt", "openai", "llm"),
+    "Business": ("business", "company", "ceo", "earnings", "profit"),
+    "Earnings": ("earnings", "revenue", "profit", "quarterly", "q1", "q2", "q3", "q4")
+}
+
+
+# One precompiled substring pattern per category
+CATEGORY_PATTERNS = {
+    category: re.compile('|'.join(
+        re.escape(keyword) for keyword in CATEGORY_KEYWORDS.get(category, (category.lower(),))
+    ))
+    for category in ALL_CATEGORIES
+}
+
+
+def filter_by_categories(df, categories):
+    """Keep only trades whose market text matches one of the selected categories"""
+    # Nothing or everything selected is the same as no filter
+    if df.empty or not 0 < len(categories) < len(ALL_CATEGORIES):
+        return df
+    return _filter_by_categories(frame_key(df), tuple(sorted(categories)), df)
+
+
+def category_keywords(categories):
+    """Flattened match keywords for SQL-side category filtering"""
+    return tuple(
+        keyword
+        for category in sorted(categories)
+        for keyword in CATEGORY_KEYWORDS.get(category, (category.lower(),))
+    )
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _filter_by_categories(key, categories, _df):
+    """Category mask over market_text, cached on frame_key(df) and the selection"""
+    mask = np.zeros(len(_df), dtype=bool)
+    for category in categories:
+        pattern = CATEGORY_PATTERNS.get(category) or re.compile(re.escape(category.lower()))
+        mask |= _df['market_text'].str.contains(pattern, na=False).to_numpy()
+    return _df[mask]
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def make_live_table(key, _df):
+    """
+    Display table for one Live Activity page as an Arrow table, cached on
+    frame_key(page). st.dataframe takes Arrow directly, so reruns reuse the
+    converted table instead of re-serializing a pandas frame each time.
+    """
+    # Categoricals become Arrow dictionary arrays without materializing Python strings
+    odds = _df['odds']
+    wallets = _df['wallet_address'].astype(str)
+
+    # Strongest red flag per trade, picked column-wise in priority order
+    ages = _df['wallet_age_days'].to_numpy(dtype='float64', na_value=np.nan)
+    signal = np.select(
+        [
+            _df['bet_size'].to_numpy() >= 50000,
+            ages < 7,  # NaN (unknown age) compares False
+            _df['odds_cents'].to_numpy() < 10
+        ],
+        ["🟣 WHALE", "🔴 NEW WALLET", "🔴 LOW ODDS"],
+        default=""
+    )
+
+    return pa.Table.from_pandas(pd.DataFrame({
+        "Risk": _df['risk_level'].map(RISK_LABELS).fillna(RISK_LABELS["LOW"]),
+        "Signal": signal,
+        "Score": _df['risk_score'],
+        "Market": _df['market_question'],
+        "Position": _df['outcome'],
+        "Bet Size": _df['bet_size'],
+        "Potential": (_df['bet_size'] / odds).where(odds > 0, 0),
+        "Entry": _df['odds_cents'],
+        "Wallet": wallets,
+        "Age": _df['wallet_age_days'],
+        "Profile": "https://polymarket.com/profile/" + wallets,
+        "Category": _df['market_category']
+    }), preserve_index=False)
+
+
+@st.cache_data(ttl=60, max_entries=16, show_spinner=False)
+def filter_live_trades(key, max_price, max_age, market_id, _df):
+    """
+    Live Activity price/age/market filters as one numpy mask, cached on
+    frame_key(df) and the filter values so unchanged reruns skip the scan.
+    """
+    # Widget defaults (100¢, 90 days, all markets) match every row, so only
+    # the active predicates are evaluated and combined in a single pass
+    masks = []
+    if market_id is not None:
+        masks.append(_df['market_id'].to_numpy() == market_id)
+    if max_age < 90:
+        ages = _df['wallet_age_days'].to_numpy(dtype='float64', na_value=np.nan)
+        masks.append(np.isnan(ages) | (ages <= max_age))
+    if max_price < 100:
+        masks.append(_df['odds_cents'].to_numpy() <= max_price)
+
+    if not masks:
+        return _df
+    return _df.loc[np.logical_and.reduce(masks)]
 
 # Use expander for collapsible category selection
 with st.expander("📂 MARKET CATEGORIES", expanded=False):
     st.caption("Select categories to monitor")
 
-    # Create compact 3-column layout for better mobile support
-    cols = st.columns(3)
-    for idx, category in enumerate(ALL_CATEGORIES):
-        col_idx = idx % 3
-        with cols[col_idx]:
-            is_selected = category in st.session_state.selected_categories
-
-            if st.button(
-                f"{'✓ ' if is_selected else ''}{category}",
-                key=f"cat_{category}",
-                use_container_width=True,
-                type="primary" if is_selected else "secondary"
-            ):
-                # Toggle category selection
-                if is_selected:
-                    st.session_state.selected_categories.remove(category)
-                else:
-                    st.session_state.selected_categories.append(category)
-                st.rerun()
+    # One widget instead of a button per category; changes rerun on their own
+    st.session_state.selected_categories = st.multiselect(
+        "Categories",
+        ALL_CATEGORIES,
+        default=st.session_state.selected_categories,
+        key="cat_select",
+        label_visibility="collapsed"
+    )
 
 # Show active categories as compact badges
 if st.session_state.selected_categories:
@@ -1142,179 +1025,251 @@ st.divider()
 # Check if monitor is initialized
 if st.session_state.monitor is None:
     with st.expander("👋 WELCOME - Get Started", expanded=True):
-        st.markdown("""
-        Configure your detection thresholds in the sidebar and click **Initialize Monitor** to begin.
-
-        **What this monitors:**
-        - 🕐 **New wallets** - Accounts created recently (configurable)
-        - 💰 **Large bets** - High-value positions ($10k+)
-        - 📉 **Low odds bets** - Betting on unlikely outcomes
-        """)
+        st.markdown(WELCOME_MD)
     st.stop()
 
 monitor = st.session_state.monitor
 
-# Get data
-suspicious_trades = monitor.get_suspicious_trades(limit=1000)
-dashboard_stats = monitor.get_dashboard_stats()
-
-if suspicious_trades:
-    df = pd.DataFrame(suspicious_trades)
-    df['detected_at'] = pd.to_datetime(df['detected_at'])
-    df['bet_size'] = df['bet_size'].astype(float)
-    df['odds'] = df['odds'].astype(float)
-    df['odds_cents'] = df['odds'] * 100  # Convert to cents for display
-
-    # Apply category filter if categories are selected
-    if st.session_state.selected_categories:
-        # Build category keywords mapping
-        category_keywords = {
-            "Politics": ["trump", "biden", "election", "president", "senate", "congress", "politics", "vote", "poll"],
-            "Sports": ["nfl", "nba", "mlb", "nhl", "soccer", "football", "basketball", "baseball", "sports", "game", "playoff"],
-            "Crypto": ["bitcoin", "crypto", "btc", "eth", "ethereum", "blockchain", "defi", "nft"],
-            "Finance": ["stock", "market", "fed", "interest", "economy", "dow", "s&p", "nasdaq", "trading"],
-            "Tech": ["tech", "apple", "google", "amazon", "microsoft", "ai", "software"],
-            "Culture": ["culture", "music", "movie", "celebrity", "entertainment"],
-            "Pop Culture": ["pop", "celebrity", "kardashian", "taylor", "beyonce"],
-            "Geopolitics": ["china", "russia", "ukraine", "war", "nato", "conflict", "israel", "gaza"],
-            "World": ["global", "international", "world", "country"],
-            "Economy": ["gdp", "inflation", "recession", "unemployment", "economic"],
-            "Climate & Science": ["climate", "science", "weather", "temperature", "carbon", "research"],
-            "Elections": ["election", "vote", "ballot", "primary", "caucus"],
-            "AI": ["ai", "artificial intelligence", "chatgpt", "openai", "llm"],
-            "Business": ["business", "company", "ceo", "earnings", "profit"],
-            "Earnings": ["earnings", "revenue", "profit", "quarterly", "q1", "q2", "q3", "q4"]
-        }
-
-        # Filter to only show trades matching selected categories
-        def matches_category(row):
-            market_text = (str(row.get('market_question', '')) + ' ' + str(row.get('market_category', ''))).lower()
-            for category in st.session_state.selected_categories:
-                keywords = category_keywords.get(category, [category.lower()])
-                if any(keyword in market_text for keyword in keywords):
-                    return True
-            return False
-
-        df = df[df.apply(matches_category, axis=1)]
-else:
-    df = pd.DataFrame()
+# Get data. Aggregates and whale cards come from SQL; row-level trades are
+# loaded further down, only by the views that display them.
+dashboard_stats = load_dashboard_stats(monitor, monitor.db_path, st.session_state.scan_nonce)
+# Nothing or everything selected is the same as no filter (see filter_by_categories)
+category_filtered = 0 < len(st.session_state.selected_categories) < len(ALL_CATEGORIES)
+category_match_keywords = (
+    category_keywords(st.session_state.selected_categories) if category_filtered else ()
+)
 
 # Show category filter status
 if st.session_state.selected_categories:
-    st.info(f"🔍 Filtering by categories: **{', '.join(st.session_state.selected_categories)}** ({len(df)} trades match)")
+    st.info(f"🔍 Filtering by categories: **{', '.join(st.session_state.selected_categories)}**")
 
 # ============================================================================
 # WHALE WATCHER - Large Trade Alerts
 # ============================================================================
-if not df.empty:
-    whale_threshold = 50000  # $50k+
-    whale_trades = df[df['bet_size'] >= whale_threshold].sort_values('detected_at', ascending=False).head(5)
-
-    if not whale_trades.empty:
-        st.markdown("### 🐋 WHALE ALERTS")
-        for _, trade in whale_trades.iterrows():
-            alert_class = "whale-alert-mega" if trade['bet_size'] >= 100000 else "whale-alert"
-            outcome_badge = "badge-yes" if trade['outcome'] == "YES" else "badge-no"
-
-            st.markdown(f'''
-            <div class="{alert_class}">
-                <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap;">
-                    <div style="flex: 1; min-width: 200px;">
-                        <div style="font-size: 1.2rem; font-weight: 700; color: #ef4444; font-family: 'Orbitron', monospace; text-shadow: 0 0 15px rgba(239, 68, 68, 0.5);">
-                            ${trade['bet_size']:,.0f}
-                        </div>
-                        <div style="color: #94a3b8; font-size: 0.85rem; margin-top: 0.25rem;">
-                            {trade['market_question'][:60]}...
-                        </div>
-                    </div>
-                    <div style="text-align: right;">
-                        <span class="{outcome_badge}">{trade['outcome']}</span>
-                        <div style="color: #64748b; font-size: 0.75rem; margin-top: 0.25rem; font-family: 'JetBrains Mono', monospace;">
-                            {trade['wallet_address'][:10]}...{trade['wallet_address'][-6:]}
-                        </div>
-                    </div>
-                </div>
-            </div>
-            ''', unsafe_allow_html=True)
+whale_threshold = 50000  # $50k+
+whale_trades = load_suspicious_df(
+    monitor, monitor.db_path, st.session_state.scan_nonce,
+    limit=5, min_bet_size=whale_threshold, keywords=category_match_keywords
+)
 
-        st.divider()
+if not whale_trades.empty:
+    st.markdown("### 🐋 WHALE ALERTS")
+    # Per-card classes computed column-wise; the loop below only formats
+    whale_trades = whale_trades.assign(
+        alert_class=np.where(whale_trades['bet_size'] >= 100000, "whale-alert-mega", "whale-alert"),
+        outcome_badge=np.where(whale_trades['outcome'] == "YES", "badge-yes", "badge-no"),
+        market_short=whale_trades['market_short'].map(html.escape)
+    )
+    whale_cards = "".join(
+        WHALE_CARD_TEMPLATE.format(**trade)
+        for trade in whale_trades.to_dict('records')
+    )
+    st.markdown(whale_cards, unsafe_allow_html=True)
+
+    st.divider()
 
 # ============================================================================
 # Key Metrics - Bento Grid Layout
 # ============================================================================
 
-# Use bento-grid for responsive metrics
-st.markdown('<div class="bento-grid">', unsafe_allow_html=True)
-
-col1, col2, col3, col4, col5 = st.columns(5)
-
-with col1:
-    st.markdown(f"""
-    <div class="metric-card">
-        <div class="metric-label">Suspicious Trades</div>
-        <div class="metric-value">{dashboard_stats.get('total_suspicious', 0):,}</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown(f"""
-    <div class="metric-card">
-        <div class="metric-label">Unique Wallets</div>
-        <div class="metric-value">{dashboard_stats.get('unique_wallets', 0):,}</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    volume = dashboard_stats.get('total_volume', 0)
-    volume_display = f"${volume/1000:.0f}K" if volume >= 1000 else f"${volume:.0f}"
-    st.markdown(f"""
-    <div class="metric-card">
-        <div class="metric-label">Total Volume</div>
-        <div class="metric-value">{volume_display}</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col4:
-    st.markdown(f"""
-    <div class="metric-card">
-        <div class="metric-label">Tracked Wallets</div>
-        <div class="metric-value">{dashboard_stats.get('tracked_wallets', 0):,}</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col5:
-    st.markdown(f"""
-    <div class="metric-card">
-        <div class="metric-label">Today's Alerts</div>
-        <div class="metric-value metric-value-red">{dashboard_stats.get('today_suspicious', 0):,}</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-st.markdown('</div>', unsafe_allow_html=True)  # Close bento-grid
+# (threshold, divisor, format) from largest to smallest
+USD_SCALES = (
+    (1e9, 1e9, "${:.1f}B"),
+    (1e6, 1e6, "${:.1f}M"),
+    (1e3, 1e3, "${:.0f}K"),
+    (0, 1, "${:.0f}")
+)
+
+
+def format_usd(value):
+    """Compact dollar amount for the metric cards ($950, $12K, $3.4M, $1.2B)"""
+    for threshold, divisor, fmt in USD_SCALES:
+        if value >= threshold:
+            return fmt.format(value / divisor)
+    return USD_SCALES[-1][2].format(value)
+
+
+volume_display = format_usd(dashboard_stats.get('total_volume', 0))
+
+# (label, value, extra value class) - all five cards go out in one markdown call
+metric_cards = [
+    ("Suspicious Trades", f"{dashboard_stats.get('total_suspicious', 0):,}", ""),
+    ("Unique Wallets", f"{dashboard_stats.get('unique_wallets', 0):,}", ""),
+    ("Total Volume", volume_display, ""),
+    ("Tracked Wallets", f"{dashboard_stats.get('tracked_wallets', 0):,}", ""),
+    ("Today's Alerts", f"{dashboard_stats.get('today_suspicious', 0):,}", " metric-value-red")
+]
+cards_html = "".join(
+    METRIC_CARD_TEMPLATE.format(label=label, value=value, value_class=value_class)
+    for label, value, value_class in metric_cards
+)
+st.markdown(f'<div class="bento-grid metric-grid">{cards_html}</div>', unsafe_allow_html=True)
 
 st.divider()
 
 
+# ============================================================================
+# Chart Builders - cached on hashable tuples so reruns skip figure construction.
+# st.cache_resource hands back the same Figure object instead of unpickling a
+# copy each rerun; callers only render the figures and never mutate them.
+# ============================================================================
+
+# Shared layout for the transparent charts (wallets, scatter, wallet age)
+CHART_LAYOUT = dict(
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+    font_color='#94a3b8',
+    xaxis=dict(gridcolor='rgba(100,116,139,0.2)'),
+    yaxis=dict(gridcolor='rgba(100,116,139,0.2)')
+)
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def make_timeline_fig(dates, counts):
+    """Daily suspicious activity bar chart"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=np.asarray(dates, dtype='datetime64[ns]'),
+        y=np.asarray(counts),
+        marker_color='#10b981',
+        marker_line_color='#059669',
+        marker_line_width=2
+    ))
+    fig.update_layout(
+        height=300,
+        paper_bgcolor='rgba(10, 14, 39, 0.5)',
+        plot_bgcolor='rgba(15, 23, 42, 0.5)',
+        font_color='#94a3b8',
+        xaxis=dict(gridcolor='rgba(16, 185, 129, 0.1)'),
+        yaxis=dict(gridcolor='rgba(16, 185, 129, 0.1)')
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def make_odds_fig(counts):
+    """Entry price histogram from precomputed bucket counts"""
+    width = 100 / len(counts)
+    fig = go.Figure(go.Bar(
+        x=np.arange(len(counts)) * width + width / 2,
+        y=counts,
+        width=width,
+        marker={'color': '#ef4444', 'line': {'width': 0}}
+    ))
+    fig.update_layout(
+        height=300,
+        paper_bgcolor='rgba(10, 14, 39, 0.5)',
+        plot_bgcolor='rgba(15, 23, 42, 0.5)',
+        font_color='#94a3b8',
+        xaxis_title="Entry Price (cents)",
+        yaxis_title="Count",
+        xaxis=dict(gridcolor='rgba(239, 68, 68, 0.1)'),
+        yaxis=dict(gridcolor='rgba(239, 68, 68, 0.1)')
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def make_wallets_fig(wallets):
+    """Top suspicious wallets bar chart from (wallet, count, volume) tuples"""
+    wallet_df = pd.DataFrame(wallets, columns=['wallet', 'count', 'volume'])
+    wallet_df['wallet_short'] = (
+        wallet_df['wallet'].str.slice(0, 8) + '...' + wallet_df['wallet'].str.slice(-6)
+    )
+
+    fig = px.bar(
+        wallet_df,
+        x='count',
+        y='wallet_short',
+        orientation='h',
+        color='volume',
+        color_continuous_scale='Viridis',
+        # Plotly formats volume client-side (d3 "$,.0f"), no per-row string column
+        hover_data={'wallet': True, 'volume': ':$,.0f'}
+    )
+    fig.update_layout(
+        height=400,
+        **CHART_LAYOUT,
+        yaxis_title="",
+        xaxis_title="Suspicious Trade Count"
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def make_scatter_fig(key, _df):
+    """Bet size vs entry price scatter, cached on frame_key(df)"""
+    fig = px.scatter(
+        _df,
+        x='odds_cents',
+        y='bet_size',
+        color='outcome',
+        size='bet_size',
+        color_discrete_map={'YES': '#10b981', 'NO': '#ef4444'},
+        hover_data=['market_question'],
+        render_mode='webgl'
+    )
+    fig.update_layout(
+        height=400,
+        **CHART_LAYOUT,
+        xaxis_title="Entry Price (cents)",
+        yaxis_title="Bet Size ($)"
+    )
+    return fig
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def make_age_fig(ages):
+    """Wallet age histogram with 7/14 day markers"""
+    fig = go.Figure(go.Histogram(
+        x=np.asarray(ages, dtype='float32'),
+        nbinsx=20,
+        marker={'color': '#f59e0b', 'line': {'width': 0}}
+    ))
+    fig.add_vline(x=7, line_dash="dash", line_color="#ef4444")
+    fig.add_vline(x=14, line_dash="dash", line_color="#f59e0b")
+    fig.update_layout(
+        height=400,
+        **CHART_LAYOUT,
+        xaxis_title="Wallet Age (days)",
+        yaxis_title="Count"
+    )
+    return fig
+
+
 # ============================================================================
 # Tabs - Enhanced Navigation
 # ============================================================================
 
-tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-    "⚡ DASHBOARD",
-    "🔴 LIVE ACTIVITY",
-    "📍 WALLET TRACKER",
-    "🎯 MARKET TRACKER",
-    "➕ ADD WALLET",
-    "📊 STATISTICS"
-])
+# A radio selector instead of st.tabs: st.tabs runs every tab body on each
+# rerun, while this only builds the view that is actually on screen
+tab1, tab2, tab3, tab4, tab5, tab6 = VIEW_LABELS
+
+active_view = st.radio(
+    "View",
+    VIEW_LABELS,
+    horizontal=True,
+    label_visibility="collapsed",
+    key="active_view"
+)
+
+# Recent trades for the row-level views, filtered by the selected categories
+df = None
+if active_view in (tab2, tab6):
+    df = filter_by_categories(
+        load_suspicious_df(monitor, monitor.db_path, st.session_state.scan_nonce, limit=1000),
+        st.session_state.selected_categories
+    )
+    if category_filtered:
+        st.caption(f"{len(df)} recent trades match the category filter")
 
 
 # ============================================================================
 # TAB 1: Dashboard
 # ============================================================================
 
-with tab1:
-    if df.empty:
+if active_view == tab1:
+    if not dashboard_stats.get('total_suspicious'):
         st.info("No suspicious activity detected yet. Run a scan to start monitoring.")
     else:
         col1, col2 = st.columns(2)
@@ -1322,46 +1277,25 @@ with tab1:
         with col1:
             # Timeline chart
             st.markdown("#### 📅 Activity Timeline")
-            df['date'] = df['detected_at'].dt.date
-            daily_counts = df.groupby('date').size().reset_index(name='count')
-            
-            fig_timeline = go.Figure()
-            fig_timeline.add_trace(go.Bar(
-                x=daily_counts['date'],
-                y=daily_counts['count'],
-                marker_color='#10b981',
-                marker_line_color='#059669',
-                marker_line_width=2
-            ))
-            fig_timeline.update_layout(
-                height=300,
-                paper_bgcolor='rgba(10, 14, 39, 0.5)',
-                plot_bgcolor='rgba(15, 23, 42, 0.5)',
-                font_color='#94a3b8',
-                xaxis=dict(gridcolor='rgba(16, 185, 129, 0.1)'),
-                yaxis=dict(gridcolor='rgba(16, 185, 129, 0.1)')
+            # Same 30-day window in SQL whether or not a category filter is on
+            daily = load_daily_counts(
+                monitor, monitor.db_path, st.session_state.scan_nonce,
+                keywords=category_match_keywords
+            )
+            fig_timeline = make_timeline_fig(
+                tuple(d['date'] for d in daily), tuple(d['count'] for d in daily)
             )
             st.plotly_chart(fig_timeline, use_container_width=True)
         
         with col2:
             # Entry price distribution
             st.markdown("#### 📉 Entry Price Distribution")
-            fig_odds = px.histogram(
-                df,
-                x='odds_cents',
-                nbins=20,
-                color_discrete_sequence=['#ef4444']
-            )
-            fig_odds.update_layout(
-                height=300,
-                paper_bgcolor='rgba(10, 14, 39, 0.5)',
-                plot_bgcolor='rgba(15, 23, 42, 0.5)',
-                font_color='#94a3b8',
-                xaxis_title="Entry Price (cents)",
-                yaxis_title="Count",
-                xaxis=dict(gridcolor='rgba(239, 68, 68, 0.1)'),
-                yaxis=dict(gridcolor='rgba(239, 68, 68, 0.1)')
+            # Whole table in SQL whether or not a category filter is on
+            odds_counts = load_odds_histogram(
+                monitor, monitor.db_path, st.session_state.scan_nonce,
+                keywords=category_match_keywords
             )
+            fig_odds = make_odds_fig(tuple(odds_counts))
             st.plotly_chart(fig_odds, use_container_width=True)
         
         # Top suspicious wallets
@@ -1369,33 +1303,9 @@ with tab1:
         
         top_wallets = dashboard_stats.get('top_wallets', [])
         if top_wallets:
-            wallet_df = pd.DataFrame(top_wallets)
-            wallet_df['wallet_short'] = wallet_df['wallet'].apply(
-                lambda x: f"{x[:8]}...{x[-6:]}"
-            )
-            wallet_df['volume_fmt'] = wallet_df['volume'].apply(
-                lambda x: f"${x:,.0f}"
-            )
-            
-            fig_wallets = px.bar(
-                wallet_df.head(10),
-                x='count',
-                y='wallet_short',
-                orientation='h',
-                color='volume',
-                color_continuous_scale='Viridis',
-                hover_data={'wallet': True, 'volume_fmt': True}
-            )
-            fig_wallets.update_layout(
-                height=400,
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font_color='#94a3b8',
-                yaxis_title="",
-                xaxis_title="Suspicious Trade Count",
-                xaxis=dict(gridcolor='rgba(100,116,139,0.2)'),
-                yaxis=dict(gridcolor='rgba(100,116,139,0.2)')
-            )
+            fig_wallets = make_wallets_fig(tuple(
+                (w['wallet'], w['count'], w['volume']) for w in top_wallets[:10]
+            ))
             st.plotly_chart(fig_wallets, use_container_width=True)
 
 
@@ -1403,7 +1313,7 @@ with tab1:
 # TAB 2: LIVE ACTIVITY - Redesigned
 # ============================================================================
 
-with tab2:
+if active_view == tab2:
     st.markdown("### 🔴 LIVE SUSPICIOUS ACTIVITY")
 
     if df.empty:
@@ -1411,157 +1321,152 @@ with tab2:
     else:
         # Enhanced Filters with Cyber Theme
         st.markdown("#### FILTERS")
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            filter_min_bet = st.number_input(
-                "Min Bet Size ($)",
-                value=0,
-                step=1000,
-                key="filter_min_bet"
-            )
-
-        with col2:
-            filter_max_price = st.slider(
-                "Max Entry Price (¢)",
-                min_value=1,
-                max_value=100,
-                value=100,
-                key="filter_max_price"
-            )
-
-        with col3:
-            filter_position = st.selectbox(
-                "Position",
-                ["All", "YES", "NO"],
-                key="filter_position"
-            )
-
-        with col4:
-            filter_age = st.slider(
-                "Max Wallet Age (days)",
-                min_value=0,
-                max_value=90,
-                value=90,
-                key="filter_age"
-            )
-
-        # Apply filters
-        filtered_df = df.copy()
-        filtered_df = filtered_df[filtered_df['bet_size'] >= filter_min_bet]
-        filtered_df = filtered_df[filtered_df['odds_cents'] <= filter_max_price]
-
-        if filter_position != "All":
-            filtered_df = filtered_df[filtered_df['outcome'] == filter_position]
-
-        if filter_age < 90:
-            filtered_df = filtered_df[
-                (filtered_df['wallet_age_days'].isna()) |
-                (filtered_df['wallet_age_days'] <= filter_age)
-            ]
+        # Filters apply together on submit instead of one rerun per widget
+        with st.form("live_filters_form", border=False):
+            col1, col2, col3, col4 = st.columns(4)
 
-        # Apply market filter from sidebar
-        if 'market_filter' in st.session_state and st.session_state.market_filter != "All Markets":
-            tracked_markets = monitor.get_tracked_markets()
-            if tracked_markets:
-                market_options = [
-                    f"{m['question'][:40]}..." if len(m['question']) > 40 else m['question']
-                    for m in tracked_markets
-                ]
-                try:
-                    idx = market_options.index(st.session_state.market_filter)
-                    selected_market_id = tracked_markets[idx]['market_id']
-                    filtered_df = filtered_df[filtered_df['market_id'] == selected_market_id]
-                except (ValueError, IndexError):
-                    pass  # Market filter not found, show all
-
-        st.markdown(f"**Showing {len(filtered_df)} trades**")
-        st.divider()
+            with col1:
+                filter_min_bet = st.number_input(
+                    "Min Bet Size ($)",
+                    value=0,
+                    step=1000,
+                    key="filter_min_bet"
+                )
 
-        # Display trades in Bento Card Style
-        for idx, row in filtered_df.head(50).iterrows():
-            # Get risk score and level
-            risk_score = row.get('risk_score', 0)
-            risk_level = row.get('risk_level', 'LOW')
-
-            # Determine alert class based on risk level
-            if risk_level == "CRITICAL":
-                alert_class = "whale-alert-mega"
-                risk_indicator = f"🔴 CRITICAL RISK (Score: {risk_score})"
-            elif risk_level == "HIGH":
-                alert_class = "whale-alert"
-                risk_indicator = f"🟠 HIGH RISK (Score: {risk_score})"
-            elif risk_level == "MEDIUM":
-                alert_class = "bento-card"
-                risk_indicator = f"🟡 MEDIUM RISK (Score: {risk_score})"
-            else:
-                alert_class = "bento-card"
-                risk_indicator = f"🟢 LOW RISK (Score: {risk_score})"
+            with col2:
+                filter_max_price = st.slider(
+                    "Max Entry Price (¢)",
+                    min_value=1,
+                    max_value=100,
+                    value=100,
+                    key="filter_max_price"
+                )
 
-            # Create bento card for each trade - use simple approach
-            badge_class = 'badge-yes' if row['outcome'] == 'YES' else 'badge-no'
+            with col3:
+                filter_position = st.selectbox(
+                    "Position",
+                    ["All", "YES", "NO"],
+                    key="filter_position"
+                )
 
-            card_html = f'<div class="{alert_class}" style="margin-bottom: 1rem;">'
-            card_html += '<div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">'
-            card_html += f'<div style="font-size: 1.1rem; font-weight: 700; color: #e2e8f0; font-family: Orbitron, sans-serif; flex: 1; margin-right: 1rem;">{row["market_question"][:100]}</div>'
-            card_html += f'<span class="{badge_class}">{row["outcome"]}</span>'
-            card_html += '</div>'
+            with col4:
+                filter_age = st.slider(
+                    "Max Wallet Age (days)",
+                    min_value=0,
+                    max_value=90,
+                    value=90,
+                    key="filter_age"
+                )
 
-            if risk_indicator:
-                card_html += f'<div style="color: #ef4444; font-size: 0.85rem; font-weight: 600; margin-bottom: 0.5rem;">{risk_indicator}</div>'
+            st.form_submit_button(
+                "Apply Filters",
+                on_click=lambda: st.session_state.update(tab2_page=0)
+            )
 
-            card_html += f'<div style="color: #64748b; font-size: 0.8rem; font-family: monospace;">Category: {row["market_category"]}</div>'
-            card_html += '</div>'
+        # Bet size and position filters run in SQL; the rest are applied in pandas
+        live_df = load_suspicious_df(
+            monitor,
+            monitor.db_path,
+            st.session_state.scan_nonce,
+            limit=1000,
+            min_bet_size=filter_min_bet or None,
+            outcome=None if filter_position == "All" else filter_position
+        )
+        filtered_df = filter_by_categories(live_df, st.session_state.selected_categories)
 
-            st.markdown(card_html, unsafe_allow_html=True)
+        # Resolve the sidebar market filter to a market id
+        selected_market_id = None  # None (no filter) when the label is stale
+        if st.session_state.get('market_filter', "All Markets") != "All Markets":
+            _, _, ids_by_label = load_tracked_markets(monitor, monitor.db_path)
+            selected_market_id = ids_by_label.get(st.session_state.market_filter)
 
-            # Trade details in columns
-            col1, col2, col3, col4 = st.columns(4)
+        if not filtered_df.empty:
+            filtered_df = filter_live_trades(
+                frame_key(filtered_df), filter_max_price, filter_age, selected_market_id, filtered_df
+            )
 
-            with col1:
-                st.markdown("**BET SIZE**")
-                st.markdown(f"<div style='font-size: 1.3rem; font-weight: 700; color: #10b981; font-family: \"Orbitron\", monospace;'>${row['bet_size']:,.0f}</div>", unsafe_allow_html=True)
-                potential = row['bet_size'] / row['odds'] if row['odds'] > 0 else 0
-                st.caption(f"Potential: ${potential:,.0f}")
+        # Server-side pagination: only one page of rows is sent to the browser
+        page_count = max(1, -(-len(filtered_df) // LIVE_PAGE_SIZE))
+        page = min(st.session_state.tab2_page, page_count - 1)
+        st.session_state.tab2_page = page
+        start = page * LIVE_PAGE_SIZE
 
-            with col2:
-                st.markdown("**ENTRY PRICE**")
-                price_color = "#ef4444" if row['odds_cents'] < 10 else "#10b981"
-                st.markdown(f"<div style='font-size: 1.3rem; font-weight: 700; color: {price_color}; font-family: \"Orbitron\", monospace;'>{row['odds_cents']:.1f}¢</div>", unsafe_allow_html=True)
-                st.caption("on the dollar")
+        col1, col2, col3 = st.columns([4, 1, 1])
+        with col1:
+            st.markdown(
+                f"**Showing {start + 1 if len(filtered_df) else 0}-{min(start + LIVE_PAGE_SIZE, len(filtered_df))} "
+                f"of {len(filtered_df)} trades** (page {page + 1}/{page_count})"
+            )
+        with col2:
+            st.button(
+                "◀ Prev",
+                key="tab2_prev",
+                disabled=page == 0,
+                use_container_width=True,
+                on_click=lambda: st.session_state.update(tab2_page=page - 1)
+            )
+        with col3:
+            st.button(
+                "Next ▶",
+                key="tab2_next",
+                disabled=page >= page_count - 1,
+                use_container_width=True,
+                on_click=lambda: st.session_state.update(tab2_page=page + 1)
+            )
+        st.divider()
 
-            with col3:
-                st.markdown("**WALLET**")
-                st.code(row['wallet_address'], language=None)
-                if row['wallet_age_days'] is not None:
-                    age_color = "#ef4444" if row['wallet_age_days'] < 7 else "#64748b"
-                    st.markdown(f"<div style='color: {age_color}; font-weight: 600;'>Age: {row['wallet_age_days']}d</div>", unsafe_allow_html=True)
-                else:
-                    st.caption("Age: Unknown", help="Could not determine wallet age")
+        # Render the trades as a single table instead of a widget stack per row
+        page_df = filtered_df.iloc[start:start + LIVE_PAGE_SIZE]
+
+        if not page_df.empty:
+            page_key = frame_key(page_df)
+            live_table = make_live_table(page_key, page_df)
+
+            # Row selection replaces a per-row Track button: select rows, track in bulk.
+            # The key follows the page contents so a stale selection never carries over
+            table_event = st.dataframe(
+                live_table,
+                column_config={
+                    "Risk": st.column_config.TextColumn("Risk", width="small"),
+                    "Signal": st.column_config.TextColumn("Signal", width="small"),
+                    "Score": st.column_config.NumberColumn("Score", format="%d"),
+                    "Market": st.column_config.TextColumn("Market", width="large"),
+                    "Bet Size": st.column_config.NumberColumn("Bet Size", format="$%d"),
+                    "Potential": st.column_config.NumberColumn("Potential", format="$%d"),
+                    "Entry": st.column_config.NumberColumn("Entry (¢)", format="%.1f¢"),
+                    "Wallet": st.column_config.TextColumn("Wallet"),
+                    "Age": st.column_config.NumberColumn("Age (days)", format="%d", help="Unknown if empty"),
+                    "Profile": st.column_config.LinkColumn("Profile", display_text="📊 View")
+                },
+                hide_index=True,
+                use_container_width=True,
+                on_select="rerun",
+                selection_mode="multi-row",
+                key=f"live_table_{page_key}"
+            )
 
-            with col4:
-                st.markdown("**ACTIONS**")
-                col_a, col_b = st.columns(2)
-                with col_a:
-                    st.link_button(
-                        "📊",
-                        f"https://polymarket.com/profile/{row['wallet_address']}",
-                        help="View Polymarket profile",
-                        use_container_width=True
-                    )
-                with col_b:
-                    if st.button("🔍", key=f"track_{row['id']}", help="Track this wallet", use_container_width=True):
-                        monitor.add_tracked_wallet(row['wallet_address'])
-                        st.success("Added to tracking!")
+            tracked_set = {
+                w['wallet_address'] for w in load_tracked_wallets(monitor, monitor.db_path)
+            }
+            selected_wallets = live_table.column("Wallet").take(table_event.selection.rows).to_pylist()
+            wallets_to_track = [w for w in dict.fromkeys(selected_wallets) if w not in tracked_set]
 
-            st.divider()
+            if st.button(
+                f"🔍 Track Selected ({len(wallets_to_track)})",
+                disabled=not wallets_to_track
+            ):
+                added = monitor.add_tracked_wallets(wallets_to_track)
+                load_tracked_wallets.clear()
+                load_dashboard_stats.clear()
+                st.session_state.flash_message = f"Added {added} wallet(s) to tracking!"
+                st.rerun()
 
 
 # ============================================================================
 # TAB 3: Wallet Tracker
 # ============================================================================
 
-with tab3:
+if active_view == tab3:
     st.markdown("#### 👛 Tracked Wallets")
     
     col1, col2 = st.columns([2, 1])
@@ -1575,10 +1480,13 @@ with tab3:
     
     with col2:
         if st.button("🔄 Refresh", key="refresh_wallets"):
+            load_tracked_wallets.clear()
+            load_dashboard_stats.clear()
+            load_wallet_stats.clear()
             st.rerun()
     
     # Get tracked wallets
-    tracked_wallets = monitor.get_tracked_wallets()
+    tracked_wallets = load_tracked_wallets(monitor, monitor.db_path)
     
     if search_query:
         # Search functionality
@@ -1603,9 +1511,12 @@ with tab3:
                     
                     with col3:
                         if st.button("Track", key=f"add_{result['wallet_address'][:8]}"):
-                            monitor.add_tracked_wallet(result['wallet_address'])
-                            st.success("Added!")
-                            st.rerun()
+                            if monitor.add_tracked_wallet(result['wallet_address']):
+                                load_tracked_wallets.clear()
+                                load_dashboard_stats.clear()
+                                st.session_state.flash_message = "Added!"
+                                st.rerun()
+                            st.error("Could not add wallet")
                     
                     st.divider()
         else:
@@ -1618,7 +1529,7 @@ with tab3:
             
             for wallet in tracked_wallets:
                 with st.container():
-                    col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+                    col1, col2, col3 = st.columns([3, 1, 1])
                     
                     with col1:
                         st.markdown(f"**{wallet.get('label', 'Unknown')}**")
@@ -1626,7 +1537,7 @@ with tab3:
                         st.caption(f"Added: {wallet['added_at'][:10]} | Alerts: {wallet.get('total_alerts', 0)}")
                     
                     with col2:
-                        stats = monitor.get_wallet_stats(wallet['wallet_address'])
+                        stats = load_wallet_stats(monitor, monitor.db_path, wallet['wallet_address'])
                         if stats:
                             st.metric("Volume", f"${stats.get('total_volume', 0):,.0f}")
                     
@@ -1636,12 +1547,26 @@ with tab3:
                             f"https://polymarket.com/profile/{wallet['wallet_address']}"
                         )
                     
-                    with col4:
-                        if st.button("🗑️", key=f"del_{wallet['wallet_address'][:8]}"):
-                            monitor.remove_tracked_wallet(wallet['wallet_address'])
-                            st.rerun()
-                    
                     st.divider()
+
+            # Batch removals in one form so picking wallets doesn't rerun the page
+            wallet_labels = {
+                w['wallet_address']: f"{w.get('label') or 'Unknown'} ({w['wallet_address'][:10]}...)"
+                for w in tracked_wallets
+            }
+            with st.form("remove_wallets_form"):
+                wallets_to_remove = st.multiselect(
+                    "Remove wallets",
+                    list(wallet_labels),
+                    format_func=wallet_labels.get
+                )
+                # Submitting with nothing selected changes nothing, so no rerun
+                if st.form_submit_button("🗑️ Remove Selected") and wallets_to_remove:
+                    for address in wallets_to_remove:
+                        monitor.remove_tracked_wallet(address)
+                    load_tracked_wallets.clear()
+                    load_dashboard_stats.clear()
+                    st.rerun()
         else:
             st.info("No wallets being tracked. Add wallets in the 'Add Wallet' tab.")
 
@@ -1650,12 +1575,45 @@ with tab3:
 # TAB 4: Market Tracker
 # ============================================================================
 
-with tab4:
+def extract_event_tags(event):
+    """Event tags as plain strings; tags arrive as strings or label/name/slug dicts"""
+    tags = []
+    for t in event.get("tags") or []:
+        if isinstance(t, str):
+            tags.append(t)
+        elif isinstance(t, dict):
+            tag_str = t.get('label') or t.get('name') or t.get('slug')
+            if tag_str:
+                tags.append(tag_str)
+    return tuple(tags)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_event_index(_monitor, categories, limit=100):
+    """
+    Active events matching the selected categories as (event, tags, tag set),
+    plus the sorted tags seen among them - built in a single pass per entry.
+    """
+    selected = frozenset(categories)
+    matched = []
+    all_tags = set()
+    for event in load_active_events(_monitor, limit=limit):
+        tags = extract_event_tags(event)
+        tag_set = frozenset(tags)
+        # No categories selected, show all
+        if not selected or tag_set & selected:
+            matched.append((event, tags, tag_set))
+            all_tags |= tag_set
+    return matched, sorted(all_tags)
+
+
+if active_view == tab4:
     st.markdown("#### 🎯 Market Tracker")
     st.markdown("Browse and track specific Polymarket markets to monitor for suspicious activity.")
 
-    # Get tracked markets
-    tracked_markets = monitor.get_tracked_markets()
+    # Get tracked markets; membership checks below use the id set, not a query per market
+    tracked_markets, _, _ = load_tracked_markets(monitor, monitor.db_path)
+    tracked_market_ids = {m['market_id'] for m in tracked_markets}
 
     col1, col2 = st.columns([2, 1])
 
@@ -1668,6 +1626,9 @@ with tab4:
 
     with col2:
         if st.button("🔄 Refresh", key="refresh_markets"):
+            load_active_events.clear()
+            load_event_index.clear()
+            load_tracked_markets.clear()
             st.rerun()
 
     st.divider()
@@ -1681,104 +1642,59 @@ with tab4:
 
         # Fetch active markets from API
         with st.spinner("Loading markets..."):
-            events = monitor.api.get_events(active=True, limit=100)
+            events = load_active_events(monitor, limit=100)
 
         if events:
-            # Filter events by selected categories first
-            filtered_events = []
-            for event in events:
-                # Extract event tags
-                event_tags = []
-                raw_tags = event.get("tags", [])
-                for t in raw_tags:
-                    if isinstance(t, str):
-                        event_tags.append(t)
-                    elif isinstance(t, dict):
-                        tag_str = t.get('label') or t.get('name') or t.get('slug')
-                        if tag_str:
-                            event_tags.append(tag_str)
-
-                # Check if event matches selected categories
-                if st.session_state.selected_categories:
-                    if any(cat in event_tags for cat in st.session_state.selected_categories):
-                        filtered_events.append(event)
-                else:
-                    # No categories selected, show all
-                    filtered_events.append(event)
+            # Tags are parsed and the category options collected in one cached pass
+            filtered_events, all_categories = load_event_index(
+                monitor, tuple(sorted(st.session_state.selected_categories)), limit=100
+            )
 
             st.markdown(f"##### Found {len(filtered_events)} matching events")
 
             # Additional category filter within results
-            all_categories = set()
-            for event in filtered_events:
-                raw_tags = event.get("tags", [])
-                for t in raw_tags:
-                    if isinstance(t, str):
-                        all_categories.add(t)
-                    elif isinstance(t, dict):
-                        tag_str = t.get('label') or t.get('name') or t.get('slug')
-                        if tag_str:
-                            all_categories.add(tag_str)
-
-            additional_filter = st.multiselect(
+            additional_filter = frozenset(st.multiselect(
                 "Further filter within results",
-                sorted(list(all_categories)),
+                all_categories,
                 default=[],
                 help="Narrow down results within your selected categories"
-            )
+            ))
 
             st.divider()
 
             # Display markets
             markets_shown = 0
-            for event in filtered_events:
+            for event_idx, (event, tags, tag_set) in enumerate(filtered_events):
                 if markets_shown >= 20:  # Limit display
-                    st.info(f"Showing first 20 markets. {len(filtered_events) - 20} more available.")
+                    st.info(f"Showing first 20 markets. {len(filtered_events) - event_idx} more events available.")
                     break
 
+                # Apply additional filter if set
+                if additional_filter and not tag_set & additional_filter:
+                    continue
+
                 markets = event.get("markets", [])
                 if not markets:
                     continue
 
-                # Apply additional filter if set
-                if additional_filter:
-                    event_tags = []
-                    raw_tags = event.get("tags", [])
-                    for t in raw_tags:
-                        if isinstance(t, str):
-                            event_tags.append(t)
-                        elif isinstance(t, dict):
-                            tag_str = t.get('label') or t.get('name') or t.get('slug')
-                            if tag_str:
-                                event_tags.append(tag_str)
-
-                    if not any(cat in event_tags for cat in additional_filter):
-                        continue
+                event_tags_str = ", ".join(tags[:3])  # First 3 tags
 
                 for market in markets:
+                    # The cap applies inside an event too, so a large event stops at 20
+                    if markets_shown >= 20:
+                        break
+
                     market_id = market.get("conditionId") or market.get("id")
                     if not market_id:
                         continue
 
                     question = market.get("question") or event.get("title", "Unknown")
 
-                    # Get market tags - handle both string and dict tags
-                    raw_tags = event.get("tags", [])
-                    tag_strings = []
-                    for t in raw_tags[:3]:  # Take first 3 tags
-                        if isinstance(t, str):
-                            tag_strings.append(t)
-                        elif isinstance(t, dict):
-                            tag_str = t.get('label') or t.get('name') or t.get('slug')
-                            if tag_str:
-                                tag_strings.append(tag_str)
-                    event_tags_str = ", ".join(tag_strings)
-
                     with st.container():
                         col1, col2, col3 = st.columns([4, 1, 1])
 
                         with col1:
-                            is_tracked = monitor.is_tracked_market(market_id)
+                            is_tracked = market_id in tracked_market_ids
                             icon = "✅ " if is_tracked else ""
                             st.markdown(f"**{icon}{question[:80]}{'...' if len(question) > 80 else ''}**")
                             st.caption(f"ID: {market_id[:16]}... | Category: {event_tags_str or 'General'}")
@@ -1794,6 +1710,7 @@ with tab4:
                             if is_tracked:
                                 if st.button("❌ Untrack", key=f"untrack_{market_id[:8]}", use_container_width=True):
                                     monitor.remove_tracked_market(market_id)
+                                    load_tracked_markets.clear()
                                     st.success("Removed!")
                                     st.rerun()
                             else:
@@ -1804,6 +1721,7 @@ with tab4:
                                         category=event_tags_str or "General",
                                         end_date=event.get("endDate")
                                     )
+                                    load_tracked_markets.clear()
                                     st.success("Added!")
                                     st.rerun()
 
@@ -1813,15 +1731,22 @@ with tab4:
             st.warning("No active markets found")
 
     else:  # Search by ID
-        market_id = st.text_input(
-            "Market/Condition ID",
-            placeholder="Enter market condition ID...",
-            help="The unique identifier for the market"
-        )
+        # The lookup only runs on submit; the result is kept in session_state
+        # so the Track/Untrack buttons below still see it on their rerun
+        with st.form("market_search_form", border=False):
+            search_id = st.text_input(
+                "Market/Condition ID",
+                placeholder="Enter market condition ID...",
+                help="The unique identifier for the market"
+            )
+            search_submitted = st.form_submit_button("🔍 Search")
 
-        if market_id and st.button("🔍 Search"):
+        if search_submitted and search_id:
             with st.spinner("Searching..."):
-                market_data = monitor.api.get_market_by_id(market_id)
+                st.session_state.market_search = (search_id, monitor.api.get_market_by_id(search_id))
+
+        if 'market_search' in st.session_state:
+            market_id, market_data = st.session_state.market_search
 
             if market_data:
                 st.success("Market found!")
@@ -1833,9 +1758,10 @@ with tab4:
                     st.caption(f"ID: {market_id}")
 
                 with col2:
-                    if monitor.is_tracked_market(market_id):
+                    if market_id in tracked_market_ids:
                         if st.button("❌ Untrack", key="untrack_search"):
                             monitor.remove_tracked_market(market_id)
+                            load_tracked_markets.clear()
                             st.success("Removed!")
                             st.rerun()
                     else:
@@ -1845,6 +1771,7 @@ with tab4:
                                 question=market_data.get('question'),
                                 category=market_data.get('tags', ['General'])[0] if market_data.get('tags') else 'General'
                             )
+                            load_tracked_markets.clear()
                             st.success("Added to tracking!")
                             st.rerun()
             else:
@@ -1857,6 +1784,11 @@ with tab4:
 
     if tracked_markets:
         st.markdown(f"##### {len(tracked_markets)} markets")
+        alert_counts = load_market_alert_counts(
+            monitor, monitor.db_path,
+            tuple(m['market_id'] for m in tracked_markets),
+            st.session_state.scan_nonce
+        )
 
         for market in tracked_markets:
             with st.container():
@@ -1867,23 +1799,12 @@ with tab4:
                     st.caption(f"Category: {market.get('category', 'Unknown')} | Added: {market['added_at'][:10]}")
 
                 with col2:
-                    # Get trade count for this market
-                    conn = monitor.db_path
-                    import sqlite3
-                    db = sqlite3.connect(conn)
-                    cursor = db.cursor()
-                    cursor.execute(
-                        "SELECT COUNT(*) FROM suspicious_trades WHERE market_id = ?",
-                        (market['market_id'],)
-                    )
-                    count = cursor.fetchone()[0]
-                    db.close()
-
-                    st.metric("Alerts", count)
+                    st.metric("Alerts", alert_counts.get(market['market_id'], 0))
 
                 with col3:
                     if st.button("🗑️ Remove", key=f"remove_{market['market_id'][:8]}"):
                         monitor.remove_tracked_market(market['market_id'])
+                        load_tracked_markets.clear()
                         st.rerun()
 
                 st.divider()
@@ -1895,7 +1816,7 @@ with tab4:
 # TAB 5: Add Wallet
 # ============================================================================
 
-with tab5:
+if active_view == tab5:
     st.markdown("#### ➕ Add Wallet to Track")
     st.markdown("Add wallets you want to monitor for suspicious activity.")
     
@@ -1932,6 +1853,8 @@ with tab5:
                     )
                     
                     if success:
+                        load_tracked_wallets.clear()
+                        load_dashboard_stats.clear()
                         st.success(f"✓ Added wallet: {wallet_address[:16]}...")
 
                         # Try to get wallet info
@@ -1966,12 +1889,11 @@ with tab5:
                 if addr.strip()
             ]
             
-            added = 0
-            for addr in addresses:
-                if addr.startswith("0x") and len(addr) == 42:
-                    if monitor.add_tracked_wallet(addr):
-                        added += 1
+            # One transaction for the whole batch; invalid addresses are skipped
+            added = monitor.add_tracked_wallets(addresses)
             
+            load_tracked_wallets.clear()
+            load_dashboard_stats.clear()
             st.success(f"Added {added}/{len(addresses)} wallets")
 
 
@@ -1979,7 +1901,7 @@ with tab5:
 # TAB 6: Statistics
 # ============================================================================
 
-with tab6:
+if active_view == tab6:
     st.markdown("#### 📈 Statistics & Insights")
     
     if df.empty:
@@ -1990,19 +1912,22 @@ with tab6:
         
         col1, col2, col3 = st.columns(3)
         
-        yes_bets = df[df['outcome'] == 'YES']
-        no_bets = df[df['outcome'] == 'NO']
+        position_agg = df.groupby('outcome', observed=True)['bet_size'].agg(['size', 'sum'])
+        position_counts = position_agg['size'].to_dict()
+        position_volumes = position_agg['sum'].to_dict()
+        yes_count = int(position_counts.get('YES', 0))
+        no_count = int(position_counts.get('NO', 0))
         
         with col1:
-            st.metric("YES Positions", len(yes_bets))
-            st.caption(f"Volume: ${yes_bets['bet_size'].sum():,.0f}")
+            st.metric("YES Positions", yes_count)
+            st.caption(f"Volume: ${position_volumes.get('YES', 0):,.0f}")
         
         with col2:
-            st.metric("NO Positions", len(no_bets))
-            st.caption(f"Volume: ${no_bets['bet_size'].sum():,.0f}")
+            st.metric("NO Positions", no_count)
+            st.caption(f"Volume: ${position_volumes.get('NO', 0):,.0f}")
         
         with col3:
-            yes_pct = (len(yes_bets) / len(df) * 100) if len(df) > 0 else 0
+            yes_pct = (yes_count / len(df) * 100) if len(df) > 0 else 0
             st.metric("YES %", f"{yes_pct:.1f}%")
         
         st.divider()
@@ -2013,51 +1938,16 @@ with tab6:
         with col1:
             st.markdown("##### 💰 Bet Size vs Entry Price")
             
-            fig_scatter = px.scatter(
-                df,
-                x='odds_cents',
-                y='bet_size',
-                color='outcome',
-                size='bet_size',
-                color_discrete_map={'YES': '#10b981', 'NO': '#ef4444'},
-                hover_data=['market_question']
-            )
-            fig_scatter.update_layout(
-                height=400,
-                paper_bgcolor='rgba(0,0,0,0)',
-                plot_bgcolor='rgba(0,0,0,0)',
-                font_color='#94a3b8',
-                xaxis_title="Entry Price (cents)",
-                yaxis_title="Bet Size ($)",
-                xaxis=dict(gridcolor='rgba(100,116,139,0.2)'),
-                yaxis=dict(gridcolor='rgba(100,116,139,0.2)')
-            )
+            fig_scatter = make_scatter_fig(frame_key(df), df)
             st.plotly_chart(fig_scatter, use_container_width=True)
         
         with col2:
             st.markdown("##### 👛 Wallet Age Distribution")
             
-            known_ages = df[df['wallet_age_days'].notna()]
+            known_ages = df['wallet_age_days'].dropna()
             
             if len(known_ages) > 0:
-                fig_age = px.histogram(
-                    known_ages,
-                    x='wallet_age_days',
-                    nbins=20,
-                    color_discrete_sequence=['#f59e0b']
-                )
-                fig_age.add_vline(x=7, line_dash="dash", line_color="#ef4444")
-                fig_age.add_vline(x=14, line_dash="dash", line_color="#f59e0b")
-                fig_age.update_layout(
-                    height=400,
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    font_color='#94a3b8',
-                    xaxis_title="Wallet Age (days)",
-                    yaxis_title="Count",
-                    xaxis=dict(gridcolor='rgba(100,116,139,0.2)'),
-                    yaxis=dict(gridcolor='rgba(100,116,139,0.2)')
-                )
+                fig_age = make_age_fig(tuple(known_ages.tolist()))
                 st.plotly_chart(fig_age, use_container_width=True)
             else:
                 st.info("No wallet age data available")
@@ -2065,21 +1955,22 @@ with tab6:
         st.divider()
         
         # Summary stats
+        summary = summarize_trades(frame_key(df), df)
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("##### 💵 Bet Size Stats")
-            st.write(f"**Average:** ${df['bet_size'].mean():,.0f}")
-            st.write(f"**Median:** ${df['bet_size'].median():,.0f}")
-            st.write(f"**Max:** ${df['bet_size'].max():,.0f}")
-            st.write(f"**Total:** ${df['bet_size'].sum():,.0f}")
+            st.write(f"**Average:** ${summary['bet_mean']:,.0f}")
+            st.write(f"**Median:** ${summary['bet_median']:,.0f}")
+            st.write(f"**Max:** ${summary['bet_max']:,.0f}")
+            st.write(f"**Total:** ${summary['bet_total']:,.0f}")
         
         with col2:
             st.markdown("##### 📉 Entry Price Stats")
-            st.write(f"**Average:** {df['odds_cents'].mean():.1f}¢")
-            st.write(f"**Median:** {df['odds_cents'].median():.1f}¢")
-            st.write(f"**Min:** {df['odds_cents'].min():.1f}¢")
-            st.write(f"**Max:** {df['odds_cents'].max():.1f}¢")
+            st.write(f"**Average:** {summary['odds_mean']:.1f}¢")
+            st.write(f"**Median:** {summary['odds_median']:.1f}¢")
+            st.write(f"**Min:** {summary['odds_min']:.1f}¢")
+            st.write(f"**Max:** {summary['odds_max']:.1f}¢")
 
 
 # ============================================================================
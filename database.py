@@ -244,16 +244,32 @@ class Database:
                     last_updated = ?
             """, (wallet, now, bet_size, now, bet_size, now))
 
-    def get_suspicious_trades(self, limit: int = 100) -> List[Dict]:
-        """Get recent suspicious trades"""
+    def get_suspicious_trades(self, limit: int = 100, min_bet_size: float = None,
+                              outcome: str = None, since: str = None) -> List[Dict]:
+        """Get recent suspicious trades, optionally filtered in SQL"""
         try:
             with self.get_cursor() as cursor:
                 placeholder = "%s" if self.db_type == "postgresql" else "?"
+
+                conditions = []
+                params = []
+                if min_bet_size:
+                    conditions.append(f"bet_size >= {placeholder}")
+                    params.append(min_bet_size)
+                if outcome:
+                    conditions.append(f"outcome = {placeholder}")
+                    params.append(outcome)
+                if since:
+                    conditions.append(f"detected_at >= {placeholder}")
+                    params.append(since)
+                where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
                 cursor.execute(f"""
                     SELECT * FROM suspicious_trades
+                    {where}
                     ORDER BY detected_at DESC
                     LIMIT {placeholder}
-                """, (limit,))
+                """, (*params, limit))
 
                 rows = cursor.fetchall()
                 if self.db_type == "postgresql":
@@ -16,7 +16,11 @@ import logging
 from dataclasses import dataclass, field
 from enum import Enum
 import hashlib
+import hmac
 import secrets
+import threading
+import traceback
+from contextlib import contextmanager
 
 # Configure logging
 logging.basicConfig(
@@ -621,7 +625,8 @@ class PolymarketMonitor:
         telegram_chat_id: str = None,
         slack_webhook_url: str = None,
         api_key: str = None,
-        config: DetectionConfig = None
+        config: DetectionConfig = None,
+        cache_size_mb: int = 8
     ):
         self.db_path = db_path
         self.config = config or DetectionConfig()
@@ -636,116 +641,159 @@ class PolymarketMonitor:
             slack_webhook_url=slack_webhook_url
         )
 
+        # One long-lived connection shared by all methods; the lock serializes
+        # access since Streamlit may call into the monitor from several threads
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        self._lock = threading.RLock()
+
+        # WAL lets the dashboard read while the worker/scans write
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        # Page cache is private to each connection; only the shared monitor asks for a large one
+        self._conn.execute(f"PRAGMA cache_size={-int(cache_size_mb) * 1024}")
+        # Sorts and temp indexes for the GROUP BY/ORDER BY queries stay in memory
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+
         self.init_database()
     
+    @contextmanager
+    def get_cursor(self, commit: bool = False):
+        """Get a cursor on the shared connection, committing or rolling back on exit"""
+        with self._lock:
+            cursor = self._conn.cursor()
+            try:
+                yield cursor
+                if commit:
+                    self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            finally:
+                cursor.close()
+    
+    def close(self):
+        """Close the shared database connection"""
+        with self._lock:
+            self._conn.close()
+    
     def init_database(self):
         """Initialize SQLite database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Suspicious trades
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS suspicious_trades (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                trade_id TEXT UNIQUE,
-                wallet_address TEXT,
-                market_id TEXT,
-                market_question TEXT,
-                market_category TEXT,
-                bet_size REAL,
-                outcome TEXT,
-                side TEXT,
-                odds REAL,
-                shares REAL,
-                timestamp TEXT,
-                transaction_hash TEXT,
-                wallet_age_days INTEGER,
-                detected_at TEXT,
-                alerted INTEGER DEFAULT 0,
-                alert_channels TEXT,
-                risk_score INTEGER DEFAULT 0,
-                risk_level TEXT DEFAULT 'LOW'
-            )
-        """)
+        with self.get_cursor(commit=True) as cursor:
+            # Suspicious trades
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS suspicious_trades (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    trade_id TEXT UNIQUE,
+                    wallet_address TEXT,
+                    market_id TEXT,
+                    market_question TEXT,
+                    market_category TEXT,
+                    bet_size REAL,
+                    outcome TEXT,
+                    side TEXT,
+                    odds REAL,
+                    shares REAL,
+                    timestamp TEXT,
+                    transaction_hash TEXT,
+                    wallet_age_days INTEGER,
+                    detected_at TEXT,
+                    alerted INTEGER DEFAULT 0,
+                    alert_channels TEXT,
+                    risk_score INTEGER DEFAULT 0,
+                    risk_level TEXT DEFAULT 'LOW'
+                )
+            """)
         
-        # Tracked wallets
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tracked_wallets (
-                wallet_address TEXT PRIMARY KEY,
-                label TEXT,
-                added_at TEXT,
-                reason TEXT,
-                active INTEGER DEFAULT 1,
-                total_alerts INTEGER DEFAULT 0,
-                last_activity TEXT
-            )
-        """)
-
-        # Users table for authentication
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                last_login TEXT,
-                is_active INTEGER DEFAULT 1
-            )
-        """)
+            # Tracked wallets
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS tracked_wallets (
+                    wallet_address TEXT PRIMARY KEY,
+                    label TEXT,
+                    added_at TEXT,
+                    reason TEXT,
+                    active INTEGER DEFAULT 1,
+                    total_alerts INTEGER DEFAULT 0,
+                    last_activity TEXT
+                )
+            """)
+
+            # Users table for authentication
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS users (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    username TEXT UNIQUE NOT NULL,
+                    email TEXT UNIQUE NOT NULL,
+                    password_hash TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    last_login TEXT,
+                    is_active INTEGER DEFAULT 1
+                )
+            """)
         
-        # Wallet analysis
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS wallet_analysis (
-                wallet_address TEXT PRIMARY KEY,
-                first_seen TEXT,
-                wallet_created_at TEXT,
-                total_bets INTEGER DEFAULT 0,
-                total_volume REAL DEFAULT 0,
-                suspicious_bets INTEGER DEFAULT 0,
-                last_updated TEXT
-            )
-        """)
+            # Wallet analysis
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS wallet_analysis (
+                    wallet_address TEXT PRIMARY KEY,
+                    first_seen TEXT,
+                    wallet_created_at TEXT,
+                    total_bets INTEGER DEFAULT 0,
+                    total_volume REAL DEFAULT 0,
+                    suspicious_bets INTEGER DEFAULT 0,
+                    last_updated TEXT
+                )
+            """)
         
-        # Markets cache
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS markets_cache (
-                market_id TEXT PRIMARY KEY,
-                question TEXT,
-                category TEXT,
-                active INTEGER,
-                cached_at TEXT
-            )
-        """)
+            # Markets cache
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS markets_cache (
+                    market_id TEXT PRIMARY KEY,
+                    question TEXT,
+                    category TEXT,
+                    active INTEGER,
+                    cached_at TEXT
+                )
+            """)
         
-        # Scan history
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS scan_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                started_at TEXT,
-                completed_at TEXT,
-                markets_scanned INTEGER,
-                trades_analyzed INTEGER,
-                suspicious_found INTEGER,
-                status TEXT
+            # Scan history
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS scan_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    started_at TEXT,
+                    completed_at TEXT,
+                    markets_scanned INTEGER,
+                    trades_analyzed INTEGER,
+                    suspicious_found INTEGER,
+                    status TEXT
+                )
+            """)
+
+            # Tracked markets
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS tracked_markets (
+                    market_id TEXT PRIMARY KEY,
+                    question TEXT,
+                    category TEXT,
+                    end_date TEXT,
+                    added_at TEXT,
+                    active INTEGER DEFAULT 1,
+                    total_alerts INTEGER DEFAULT 0
+                )
+            """)
+            
+            # Indexes for the dashboard's lookups (tracked_wallets and
+            # tracked_markets are already keyed by their ids)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_suspicious_market ON suspicious_trades(market_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_suspicious_detected ON suspicious_trades(detected_at)")
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_suspicious_wallet ON suspicious_trades(wallet_address, detected_at)"
             )
-        """)
-
-        # Tracked markets
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS tracked_markets (
-                market_id TEXT PRIMARY KEY,
-                question TEXT,
-                category TEXT,
-                end_date TEXT,
-                added_at TEXT,
-                active INTEGER DEFAULT 1,
-                total_alerts INTEGER DEFAULT 0
+            # Covering index for the top-wallets GROUP BY (count and bet_size sum)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_suspicious_wallet_volume ON suspicious_trades(wallet_address, bet_size)"
             )
-        """)
-
-        conn.commit()
-        conn.close()
+            # Refresh planner statistics for any index that needs them (cheap when current)
+            cursor.execute("PRAGMA optimize")
         logger.info("Database initialized")
 
     # =========================================================================
@@ -764,7 +812,8 @@ class PolymarketMonitor:
         """Verify password against hash"""
         try:
             salt, pwd_hash = password_hash.split('$')
-            return hashlib.sha256((password + salt).encode()).hexdigest() == pwd_hash
+            candidate = hashlib.sha256((password + salt).encode()).hexdigest()
+            return hmac.compare_digest(candidate, pwd_hash)
         except:
             return False
 
@@ -782,32 +831,27 @@ class PolymarketMonitor:
             if '@' not in email:
                 return False, "Invalid email address"
 
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Check if username or email already exists
-            cursor.execute(
-                "SELECT username, email FROM users WHERE username = ? OR email = ?",
-                (username, email)
-            )
-            existing = cursor.fetchone()
+            with self.get_cursor(commit=True) as cursor:
+                # Check if username or email already exists
+                cursor.execute(
+                    "SELECT username, email FROM users WHERE username = ? OR email = ?",
+                    (username, email)
+                )
+                existing = cursor.fetchone()
 
-            if existing:
-                conn.close()
-                if existing[0] == username:
-                    return False, "Username already exists"
-                else:
-                    return False, "Email already registered"
+                if existing:
+                    if existing[0] == username:
+                        return False, "Username already exists"
+                    else:
+                        return False, "Email already registered"
 
-            # Create user
-            password_hash = self.hash_password(password)
-            cursor.execute("""
-                INSERT INTO users (username, email, password_hash, created_at, is_active)
-                VALUES (?, ?, ?, ?, 1)
-            """, (username, email, password_hash, datetime.now().isoformat()))
+                # Create user
+                password_hash = self.hash_password(password)
+                cursor.execute("""
+                    INSERT INTO users (username, email, password_hash, created_at, is_active)
+                    VALUES (?, ?, ?, ?, 1)
+                """, (username, email, password_hash, datetime.now().isoformat()))
 
-            conn.commit()
-            conn.close()
             logger.info(f"User created: {username}")
             return True, "Account created successfully!"
 
@@ -815,46 +859,44 @@ class PolymarketMonitor:
             logger.error(f"Error creating user: {e}")
             return False, f"Error: {str(e)}"
 
-    def authenticate_user(self, username: str, password: str) -> Tuple[bool, Optional[Dict]]:
-        """
-        Authenticate user credentials
-        Returns: (success, user_data)
-        """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
+    def _get_user_credentials(self, username: str) -> Optional[Tuple]:
+        """Get (id, username, email, password_hash, is_active) for a user"""
+        with self.get_cursor() as cursor:
             cursor.execute("""
                 SELECT id, username, email, password_hash, is_active
                 FROM users
                 WHERE username = ?
+                LIMIT 1
             """, (username,))
+            return cursor.fetchone()
 
-            row = cursor.fetchone()
+    def authenticate_user(self, username: str, password: str) -> Tuple[bool, Optional[Dict]]:
+        """
+        Authenticate user credentials
+        Returns: (success, user_data)
+        """
+        try:
+            row = self._get_user_credentials(username)
 
+            # Unknown usernames short-circuit before any hashing
             if not row:
-                conn.close()
                 return False, None
 
             user_id, username, email, password_hash, is_active = row
 
             if not is_active:
-                conn.close()
                 return False, None
 
             if not self.verify_password(password, password_hash):
-                conn.close()
                 return False, None
 
-            # Update last login
-            cursor.execute("""
-                UPDATE users
-                SET last_login = ?
-                WHERE id = ?
-            """, (datetime.now().isoformat(), user_id))
-
-            conn.commit()
-            conn.close()
+            with self.get_cursor(commit=True) as cursor:
+                # Update last login
+                cursor.execute("""
+                    UPDATE users
+                    SET last_login = ?
+                    WHERE id = ?
+                """, (datetime.now().isoformat(), user_id))
 
             user_data = {
                 "id": user_id,
@@ -886,39 +928,62 @@ class PolymarketMonitor:
             if not wallet_address.startswith("0x") or len(wallet_address) != 42:
                 return False
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT OR REPLACE INTO tracked_wallets 
-                (wallet_address, label, added_at, reason, active)
-                VALUES (?, ?, ?, ?, 1)
-            """, (
-                wallet_address,
-                label or f"Wallet {wallet_address[:8]}",
-                datetime.now().isoformat(),
-                reason or "Manually added"
-            ))
-            
-            conn.commit()
-            conn.close()
+            with self.get_cursor(commit=True) as cursor:
+                cursor.execute("""
+                    INSERT OR REPLACE INTO tracked_wallets 
+                    (wallet_address, label, added_at, reason, active)
+                    VALUES (?, ?, ?, ?, 1)
+                """, (
+                    wallet_address,
+                    label or f"Wallet {wallet_address[:8]}",
+                    datetime.now().isoformat(),
+                    reason or "Manually added"
+                ))
             return True
             
         except Exception as e:
             logger.error(f"Error adding tracked wallet: {e}")
             return False
     
+    def add_tracked_wallets(self, wallet_addresses: List[str], reason: str = None) -> int:
+        """
+        Add many wallets to the tracking list in one transaction.
+        Invalid and already-tracked addresses are skipped (existing labels and
+        alert counts are kept); returns the number of wallets newly added.
+        """
+        try:
+            addresses = dict.fromkeys(
+                a for a in (addr.lower().strip() for addr in wallet_addresses)
+                if a.startswith("0x") and len(a) == 42
+            )
+            if not addresses:
+                return 0
+            
+            added_at = datetime.now().isoformat()
+            with self.get_cursor(commit=True) as cursor:
+                cursor.executemany("""
+                    INSERT OR IGNORE INTO tracked_wallets 
+                    (wallet_address, label, added_at, reason, active)
+                    VALUES (?, ?, ?, ?, 1)
+                """, [
+                    (address, f"Wallet {address[:8]}", added_at, reason or "Manually added")
+                    for address in addresses
+                ])
+                # executemany sums rowcount; ignored rows contribute 0
+                return cursor.rowcount
+            
+        except Exception as e:
+            logger.error(f"Error adding tracked wallets: {e}")
+            return 0
+    
     def remove_tracked_wallet(self, wallet_address: str) -> bool:
         """Remove wallet from tracking"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                "DELETE FROM tracked_wallets WHERE wallet_address = ?",
-                (wallet_address.lower(),)
-            )
-            conn.commit()
-            conn.close()
+            with self.get_cursor(commit=True) as cursor:
+                cursor.execute(
+                    "DELETE FROM tracked_wallets WHERE wallet_address = ?",
+                    (wallet_address.lower(),)
+                )
             return True
         except Exception as e:
             logger.error(f"Error removing wallet: {e}")
@@ -927,17 +992,14 @@ class PolymarketMonitor:
     def get_tracked_wallets(self, active_only: bool = True) -> List[Dict]:
         """Get all tracked wallets"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            if active_only:
-                cursor.execute("SELECT * FROM tracked_wallets WHERE active = 1")
-            else:
-                cursor.execute("SELECT * FROM tracked_wallets")
+            with self.get_cursor() as cursor:
+                if active_only:
+                    cursor.execute("SELECT * FROM tracked_wallets WHERE active = 1")
+                else:
+                    cursor.execute("SELECT * FROM tracked_wallets")
             
-            columns = [d[0] for d in cursor.description]
-            wallets = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            conn.close()
+                columns = [d[0] for d in cursor.description]
+                wallets = [dict(zip(columns, row)) for row in cursor.fetchall()]
             return wallets
             
         except Exception as e:
@@ -947,24 +1009,21 @@ class PolymarketMonitor:
     def search_wallets(self, query: str) -> List[Dict]:
         """Search wallets by address or label"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            search_term = f"%{query}%"
-            cursor.execute("""
-                SELECT DISTINCT wallet_address, 'tracked' as source, label as info
-                FROM tracked_wallets 
-                WHERE wallet_address LIKE ? OR label LIKE ?
-                UNION
-                SELECT DISTINCT wallet_address, 'suspicious' as source, 
-                       CAST(suspicious_bets AS TEXT) || ' suspicious bets' as info
-                FROM wallet_analysis 
-                WHERE wallet_address LIKE ?
-            """, (search_term, search_term, search_term))
-            
-            columns = ['wallet_address', 'source', 'info']
-            results = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            conn.close()
+            with self.get_cursor() as cursor:
+                search_term = f"%{query}%"
+                cursor.execute("""
+                    SELECT DISTINCT wallet_address, 'tracked' as source, label as info
+                    FROM tracked_wallets 
+                    WHERE wallet_address LIKE ? OR label LIKE ?
+                    UNION
+                    SELECT DISTINCT wallet_address, 'suspicious' as source, 
+                           CAST(suspicious_bets AS TEXT) || ' suspicious bets' as info
+                    FROM wallet_analysis 
+                    WHERE wallet_address LIKE ?
+                """, (search_term, search_term, search_term))
+            
+                columns = ['wallet_address', 'source', 'info']
+                results = [dict(zip(columns, row)) for row in cursor.fetchall()]
             return results
             
         except Exception as e:
@@ -974,14 +1033,12 @@ class PolymarketMonitor:
     def is_tracked_wallet(self, wallet_address: str) -> bool:
         """Check if wallet is being tracked"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT 1 FROM tracked_wallets WHERE wallet_address = ? AND active = 1",
-                (wallet_address.lower(),)
-            )
-            result = cursor.fetchone() is not None
-            conn.close()
+            with self.get_cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM tracked_wallets WHERE wallet_address = ? AND active = 1",
+                    (wallet_address.lower(),)
+                )
+                result = cursor.fetchone() is not None
             return result
         except:
             return False
@@ -995,23 +1052,18 @@ class PolymarketMonitor:
     ) -> bool:
         """Add market to tracking list"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT OR REPLACE INTO tracked_markets
-                (market_id, question, category, end_date, added_at, active)
-                VALUES (?, ?, ?, ?, ?, 1)
-            """, (
-                market_id,
-                question or f"Market {market_id[:8]}...",
-                category or "Unknown",
-                end_date,
-                datetime.now().isoformat()
-            ))
-
-            conn.commit()
-            conn.close()
+            with self.get_cursor(commit=True) as cursor:
+                cursor.execute("""
+                    INSERT OR REPLACE INTO tracked_markets
+                    (market_id, question, category, end_date, added_at, active)
+                    VALUES (?, ?, ?, ?, ?, 1)
+                """, (
+                    market_id,
+                    question or f"Market {market_id[:8]}...",
+                    category or "Unknown",
+                    end_date,
+                    datetime.now().isoformat()
+                ))
             return True
 
         except Exception as e:
@@ -1021,14 +1073,11 @@ class PolymarketMonitor:
     def remove_tracked_market(self, market_id: str) -> bool:
         """Remove market from tracking"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                "DELETE FROM tracked_markets WHERE market_id = ?",
-                (market_id,)
-            )
-            conn.commit()
-            conn.close()
+            with self.get_cursor(commit=True) as cursor:
+                cursor.execute(
+                    "DELETE FROM tracked_markets WHERE market_id = ?",
+                    (market_id,)
+                )
             return True
         except Exception as e:
             logger.error(f"Error removing market: {e}")
@@ -1037,34 +1086,46 @@ class PolymarketMonitor:
     def get_tracked_markets(self, active_only: bool = True) -> List[Dict]:
         """Get all tracked markets"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            if active_only:
-                cursor.execute("SELECT * FROM tracked_markets WHERE active = 1")
-            else:
-                cursor.execute("SELECT * FROM tracked_markets")
+            with self.get_cursor() as cursor:
+                if active_only:
+                    cursor.execute("SELECT * FROM tracked_markets WHERE active = 1")
+                else:
+                    cursor.execute("SELECT * FROM tracked_markets")
 
-            columns = [d[0] for d in cursor.description]
-            markets = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            conn.close()
+                columns = [d[0] for d in cursor.description]
+                markets = [dict(zip(columns, row)) for row in cursor.fetchall()]
             return markets
 
         except Exception as e:
             logger.error(f"Error fetching tracked markets: {e}")
             return []
 
+    def get_market_alert_counts(self, market_ids: List[str]) -> Dict[str, int]:
+        """Suspicious trade counts for several markets in one grouped query"""
+        if not market_ids:
+            return {}
+        try:
+            placeholders = ", ".join("?" * len(market_ids))
+            with self.get_cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT market_id, COUNT(*) FROM suspicious_trades
+                    WHERE market_id IN ({placeholders})
+                    GROUP BY market_id
+                """, tuple(market_ids))
+                return dict(cursor.fetchall())
+        except Exception as e:
+            logger.error(f"Error fetching market alert counts: {e}")
+            return {}
+    
     def is_tracked_market(self, market_id: str) -> bool:
         """Check if market is being tracked"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT 1 FROM tracked_markets WHERE market_id = ? AND active = 1",
-                (market_id,)
-            )
-            result = cursor.fetchone() is not None
-            conn.close()
+            with self.get_cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM tracked_markets WHERE market_id = ? AND active = 1",
+                    (market_id,)
+                )
+                result = cursor.fetchone() is not None
             return result
         except:
             return False
@@ -1122,20 +1183,17 @@ class PolymarketMonitor:
         # Factor 4: Check for rapid trading (velocity)
         # Get recent trades from this wallet
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-
-            # Check trades in last hour
-            current_time = datetime.now()
-            one_hour_ago = (current_time - timedelta(hours=1)).isoformat()
+            with self.get_cursor() as cursor:
+                # Check trades in last hour
+                current_time = datetime.now()
+                one_hour_ago = (current_time - timedelta(hours=1)).isoformat()
 
-            cursor.execute("""
-                SELECT COUNT(*) FROM suspicious_trades
-                WHERE wallet_address = ? AND detected_at > ?
-            """, (trade_data['wallet_address'], one_hour_ago))
+                cursor.execute("""
+                    SELECT COUNT(*) FROM suspicious_trades
+                    WHERE wallet_address = ? AND detected_at > ?
+                """, (trade_data['wallet_address'], one_hour_ago))
 
-            recent_count = cursor.fetchone()[0]
-            conn.close()
+                recent_count = cursor.fetchone()[0]
 
             # Velocity scoring
             if recent_count >= 10:
@@ -1270,62 +1328,57 @@ class PolymarketMonitor:
     def save_suspicious_trade(self, trade_data: Dict) -> bool:
         """Save suspicious trade to database"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT OR IGNORE INTO suspicious_trades
-                (trade_id, wallet_address, market_id, market_question, market_category,
-                 bet_size, outcome, side, odds, shares, timestamp, transaction_hash,
-                 wallet_age_days, detected_at, risk_score, risk_level)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trade_data["trade_id"],
-                trade_data["wallet_address"],
-                trade_data["market_id"],
-                trade_data["market_question"],
-                trade_data["market_category"],
-                trade_data["bet_size"],
-                trade_data["outcome"],
-                trade_data["side"],
-                trade_data["odds"],
-                trade_data["shares"],
-                trade_data["timestamp"],
-                trade_data.get("transaction_hash"),
-                trade_data["wallet_age_days"],
-                datetime.now().isoformat(),
-                trade_data.get("risk_score", 0),
-                trade_data.get("risk_level", "LOW")
-            ))
-            
-            # Update wallet analysis
-            cursor.execute("""
-                INSERT INTO wallet_analysis 
-                (wallet_address, first_seen, total_bets, total_volume, suspicious_bets, last_updated)
-                VALUES (?, ?, 1, ?, 1, ?)
-                ON CONFLICT(wallet_address) DO UPDATE SET
-                    total_bets = total_bets + 1,
-                    total_volume = total_volume + ?,
-                    suspicious_bets = suspicious_bets + 1,
-                    last_updated = ?
-            """, (
-                trade_data["wallet_address"],
-                datetime.now().isoformat(),
-                trade_data["bet_size"],
-                datetime.now().isoformat(),
-                trade_data["bet_size"],
-                datetime.now().isoformat()
-            ))
-            
-            # Update tracked wallet if applicable
-            cursor.execute("""
-                UPDATE tracked_wallets 
-                SET total_alerts = total_alerts + 1, last_activity = ?
-                WHERE wallet_address = ?
-            """, (datetime.now().isoformat(), trade_data["wallet_address"]))
-            
-            conn.commit()
-            conn.close()
+            with self.get_cursor(commit=True) as cursor:
+                cursor.execute("""
+                    INSERT OR IGNORE INTO suspicious_trades
+                    (trade_id, wallet_address, market_id, market_question, market_category,
+                     bet_size, outcome, side, odds, shares, timestamp, transaction_hash,
+                     wallet_age_days, detected_at, risk_score, risk_level)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    trade_data["trade_id"],
+                    trade_data["wallet_address"],
+                    trade_data["market_id"],
+                    trade_data["market_question"],
+                    trade_data["market_category"],
+                    trade_data["bet_size"],
+                    trade_data["outcome"],
+                    trade_data["side"],
+                    trade_data["odds"],
+                    trade_data["shares"],
+                    trade_data["timestamp"],
+                    trade_data.get("transaction_hash"),
+                    trade_data["wallet_age_days"],
+                    datetime.now().isoformat(),
+                    trade_data.get("risk_score", 0),
+                    trade_data.get("risk_level", "LOW")
+                ))
+            
+                # Update wallet analysis
+                cursor.execute("""
+                    INSERT INTO wallet_analysis 
+                    (wallet_address, first_seen, total_bets, total_volume, suspicious_bets, last_updated)
+                    VALUES (?, ?, 1, ?, 1, ?)
+                    ON CONFLICT(wallet_address) DO UPDATE SET
+                        total_bets = total_bets + 1,
+                        total_volume = total_volume + ?,
+                        suspicious_bets = suspicious_bets + 1,
+                        last_updated = ?
+                """, (
+                    trade_data["wallet_address"],
+                    datetime.now().isoformat(),
+                    trade_data["bet_size"],
+                    datetime.now().isoformat(),
+                    trade_data["bet_size"],
+                    datetime.now().isoformat()
+                ))
+            
+                # Update tracked wallet if applicable
+                cursor.execute("""
+                    UPDATE tracked_wallets 
+                    SET total_alerts = total_alerts + 1, last_activity = ?
+                    WHERE wallet_address = ?
+                """, (datetime.now().isoformat(), trade_data["wallet_address"]))
             return True
             
         except Exception as e:
@@ -1375,18 +1428,15 @@ class PolymarketMonitor:
                             
                             # Update alert status
                             try:
-                                conn = sqlite3.connect(self.db_path)
-                                cursor = conn.cursor()
-                                cursor.execute("""
-                                    UPDATE suspicious_trades 
-                                    SET alerted = 1, alert_channels = ?
-                                    WHERE trade_id = ?
-                                """, (
-                                    ",".join(k for k, v in results.items() if v),
-                                    suspicious_data["trade_id"]
-                                ))
-                                conn.commit()
-                                conn.close()
+                                with self.get_cursor(commit=True) as cursor:
+                                    cursor.execute("""
+                                        UPDATE suspicious_trades 
+                                        SET alerted = 1, alert_channels = ?
+                                        WHERE trade_id = ?
+                                    """, (
+                                        ",".join(k for k, v in results.items() if v),
+                                        suspicious_data["trade_id"]
+                                    ))
                             except:
                                 pass
             
@@ -1465,25 +1515,27 @@ class PolymarketMonitor:
             # Get active events
             events = self.api.get_events(active=True, limit=100)
             
+            # Lowercased once, so each event's check is a set intersection
+            wanted = frozenset(cat.lower() for cat in categories) if categories else None
+            
             for event in events:
                 markets = event.get("markets", [])
 
                 # Tags can be strings or dicts - handle both cases
                 raw_tags = event.get("tags", [])
-                tags = []
+                tags = set()
                 for t in raw_tags:
                     if isinstance(t, str):
-                        tags.append(t.lower())
+                        tags.add(t.lower())
                     elif isinstance(t, dict):
                         # If tag is a dict, try to get the 'label' or 'name' field
                         tag_str = t.get('label') or t.get('name') or t.get('slug') or ''
                         if tag_str:
-                            tags.append(tag_str.lower())
+                            tags.add(tag_str.lower())
 
                 # Filter by categories if specified
-                if categories:
-                    if not any(cat.lower() in tags for cat in categories):
-                        continue
+                if wanted and not wanted & tags:
+                    continue
                 
                 for market in markets:
                     condition_id = market.get("conditionId") or market.get("id")
@@ -1520,7 +1572,6 @@ class PolymarketMonitor:
             return stats
             
         except Exception as e:
-            import traceback
             logger.error(f"Full scan error: {e}")
             logger.error(f"Traceback: {traceback.format_exc()}")
             return stats
@@ -1528,150 +1579,267 @@ class PolymarketMonitor:
     def _log_scan(self, stats: Dict):
         """Log scan to history"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                INSERT INTO scan_history 
-                (started_at, completed_at, markets_scanned, trades_analyzed, 
-                 suspicious_found, status)
-                VALUES (?, ?, ?, ?, ?, 'completed')
-            """, (
-                datetime.now().isoformat(),
-                datetime.now().isoformat(),
-                stats.get("markets_scanned", 0),
-                stats.get("trades_analyzed", 0),
-                stats.get("suspicious_found", 0)
-            ))
-            
-            conn.commit()
-            conn.close()
+            with self.get_cursor(commit=True) as cursor:
+                cursor.execute("""
+                    INSERT INTO scan_history 
+                    (started_at, completed_at, markets_scanned, trades_analyzed, 
+                     suspicious_found, status)
+                    VALUES (?, ?, ?, ?, ?, 'completed')
+                """, (
+                    datetime.now().isoformat(),
+                    datetime.now().isoformat(),
+                    stats.get("markets_scanned", 0),
+                    stats.get("trades_analyzed", 0),
+                    stats.get("suspicious_found", 0)
+                ))
         except Exception as e:
             logger.error(f"Error logging scan: {e}")
     
-    def get_suspicious_trades(self, limit: int = 100, offset: int = 0) -> List[Dict]:
-        """Get suspicious trades from database"""
+    def get_suspicious_trades(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        min_bet_size: float = None,
+        outcome: str = None,
+        since: str = None,
+        columns: List[str] = None,
+        keywords: List[str] = None
+    ) -> List[Dict]:
+        """
+        Get suspicious trades from database
+
+        Optional filters are applied in SQL so only matching rows are loaded:
+        - min_bet_size: only trades with bet_size >= this amount (USD)
+        - outcome: only trades on this outcome (YES or NO)
+        - since: ISO timestamp, only trades detected at or after it
+        - columns: fetch only these suspicious_trades columns (default: all)
+        - keywords: only trades whose market text contains one of these
+        """
+        names, rows = self.get_suspicious_trade_rows(
+            limit, offset, min_bet_size, outcome, since, columns, keywords
+        )
+        return [dict(zip(names, row)) for row in rows]
+    
+    def get_suspicious_trade_rows(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        min_bet_size: float = None,
+        outcome: str = None,
+        since: str = None,
+        columns: List[str] = None,
+        keywords: List[str] = None
+    ) -> Tuple[List[str], List[Tuple]]:
+        """
+        Same query and filters as get_suspicious_trades, but returns the column
+        names and raw row tuples so callers building a DataFrame skip the
+        per-row dicts.
+        """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT * FROM suspicious_trades 
-                ORDER BY detected_at DESC 
-                LIMIT ? OFFSET ?
-            """, (limit, offset))
-            
-            columns = [d[0] for d in cursor.description]
-            trades = [dict(zip(columns, row)) for row in cursor.fetchall()]
-            conn.close()
-            return trades
+            with self.get_cursor() as cursor:
+                conditions = []
+                params = []
+                if min_bet_size:
+                    conditions.append("bet_size >= ?")
+                    params.append(min_bet_size)
+                if outcome:
+                    conditions.append("outcome = ?")
+                    params.append(outcome)
+                if since:
+                    conditions.append("detected_at >= ?")
+                    params.append(since)
+                if keywords:
+                    clause, keyword_params = self._keyword_condition(keywords)
+                    conditions.append(clause)
+                    params.extend(keyword_params)
+                where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+                selected = ", ".join(columns) if columns else "*"
+
+                cursor.execute(f"""
+                    SELECT {selected} FROM suspicious_trades
+                    {where}
+                    ORDER BY detected_at DESC
+                    LIMIT ? OFFSET ?
+                """, (*params, limit, offset))
+            
+                names = [d[0] for d in cursor.description]
+                return names, cursor.fetchall()
             
         except Exception as e:
             logger.error(f"Error fetching trades: {e}")
-            return []
+            return [], []
     
     def get_wallet_stats(self, wallet_address: str) -> Optional[Dict]:
         """Get stats for a wallet"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute(
-                "SELECT * FROM wallet_analysis WHERE wallet_address = ?",
-                (wallet_address.lower(),)
-            )
-            row = cursor.fetchone()
+            with self.get_cursor() as cursor:
+                cursor.execute(
+                    "SELECT * FROM wallet_analysis WHERE wallet_address = ?",
+                    (wallet_address.lower(),)
+                )
+                row = cursor.fetchone()
             
-            if row:
-                columns = [d[0] for d in cursor.description]
-                stats = dict(zip(columns, row))
+                if row:
+                    columns = [d[0] for d in cursor.description]
+                    stats = dict(zip(columns, row))
                 
-                # Get trades
-                cursor.execute("""
-                    SELECT * FROM suspicious_trades 
-                    WHERE wallet_address = ?
-                    ORDER BY timestamp DESC
-                """, (wallet_address.lower(),))
+                    # Get trades
+                    cursor.execute("""
+                        SELECT * FROM suspicious_trades 
+                        WHERE wallet_address = ?
+                        ORDER BY timestamp DESC
+                    """, (wallet_address.lower(),))
                 
-                trade_cols = [d[0] for d in cursor.description]
-                stats["trades"] = [dict(zip(trade_cols, r)) for r in cursor.fetchall()]
+                    trade_cols = [d[0] for d in cursor.description]
+                    stats["trades"] = [dict(zip(trade_cols, r)) for r in cursor.fetchall()]
                 
-                # Check if tracked
-                cursor.execute(
-                    "SELECT * FROM tracked_wallets WHERE wallet_address = ?",
-                    (wallet_address.lower(),)
-                )
-                tracked = cursor.fetchone()
-                stats["is_tracked"] = tracked is not None
+                    # Check if tracked
+                    cursor.execute(
+                        "SELECT * FROM tracked_wallets WHERE wallet_address = ?",
+                        (wallet_address.lower(),)
+                    )
+                    tracked = cursor.fetchone()
+                    stats["is_tracked"] = tracked is not None
                 
-                conn.close()
-                return stats
-            
-            conn.close()
+                    return stats
             return None
             
         except Exception as e:
             logger.error(f"Error fetching wallet stats: {e}")
             return None
     
-    def get_dashboard_stats(self) -> Dict:
-        """Get aggregate stats for dashboard"""
+    def get_summary_counts(self) -> Dict:
+        """Get headline counts for the dashboard in a single query"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            stats = {}
-            
-            cursor.execute("SELECT COUNT(*) FROM suspicious_trades")
-            stats["total_suspicious"] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(DISTINCT wallet_address) FROM suspicious_trades")
-            stats["unique_wallets"] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COALESCE(SUM(bet_size), 0) FROM suspicious_trades")
-            stats["total_volume"] = cursor.fetchone()[0]
+            with self.get_cursor() as cursor:
+                today = datetime.now().date().isoformat()
+                cursor.execute("""
+                    SELECT 
+                        COUNT(*),
+                        COUNT(DISTINCT wallet_address),
+                        COALESCE(SUM(bet_size), 0),
+                        COALESCE(SUM(CASE WHEN alerted = 1 THEN 1 ELSE 0 END), 0),
+                        COALESCE(SUM(CASE WHEN DATE(detected_at) = ? THEN 1 ELSE 0 END), 0),
+                        (SELECT COUNT(*) FROM tracked_wallets WHERE active = 1)
+                    FROM suspicious_trades
+                """, (today,))
+                row = cursor.fetchone()
             
-            cursor.execute("SELECT COUNT(*) FROM suspicious_trades WHERE alerted = 1")
-            stats["alerts_sent"] = cursor.fetchone()[0]
+            return {
+                "total_suspicious": row[0],
+                "unique_wallets": row[1],
+                "total_volume": row[2],
+                "alerts_sent": row[3],
+                "today_suspicious": row[4],
+                "tracked_wallets": row[5]
+            }
             
-            cursor.execute("SELECT COUNT(*) FROM tracked_wallets WHERE active = 1")
-            stats["tracked_wallets"] = cursor.fetchone()[0]
+        except Exception as e:
+            logger.error(f"Error fetching summary counts: {e}")
+            return {}
+    
+    @staticmethod
+    def _keyword_condition(keywords: List[str]) -> Tuple[str, List[str]]:
+        """
+        SQL condition matching trades whose lowercased market question or
+        category contains any of `keywords` (the dashboard's category filter)
+        """
+        text = "LOWER(COALESCE(market_question, '') || ' ' || COALESCE(market_category, ''))"
+        clause = " OR ".join(f"{text} LIKE ? ESCAPE '\\'" for _ in keywords)
+        params = [
+            "%" + kw.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            for kw in keywords
+        ]
+        return f"({clause})", params
+    
+    def get_daily_counts(self, days: int = 30, keywords: List[str] = None) -> List[Dict]:
+        """
+        Suspicious trades per day over the last `days` days, grouped in SQL.
+        - keywords: only count trades whose market text contains one of these
+        """
+        try:
+            since = (datetime.now() - timedelta(days=days)).isoformat()
+            conditions = ["detected_at >= ?"]
+            params = [since]
+            if keywords:
+                clause, keyword_params = self._keyword_condition(keywords)
+                conditions.append(clause)
+                params.extend(keyword_params)
+            with self.get_cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT DATE(detected_at) as date, COUNT(*) as count
+                    FROM suspicious_trades 
+                    WHERE {' AND '.join(conditions)}
+                    GROUP BY DATE(detected_at)
+                    ORDER BY date
+                """, params)
+                return [
+                    {"date": row[0], "count": row[1]} 
+                    for row in cursor.fetchall()
+                ]
             
-            today = datetime.now().date().isoformat()
-            cursor.execute(
-                "SELECT COUNT(*) FROM suspicious_trades WHERE DATE(detected_at) = ?",
-                (today,)
-            )
-            stats["today_suspicious"] = cursor.fetchone()[0]
+        except Exception as e:
+            logger.error(f"Error fetching daily counts: {e}")
+            return []
+    
+    def get_odds_histogram(self, bins: int = 20, keywords: List[str] = None) -> List[int]:
+        """
+        Trade counts per entry-price bucket, computed in SQL.
+        Buckets split 0-100 cents evenly; 100 cents falls in the last one.
+        - keywords: only count trades whose market text contains one of these
+        """
+        try:
+            counts = [0] * bins
+            conditions = ["odds IS NOT NULL"]
+            params = [bins, bins - 1]
+            if keywords:
+                clause, keyword_params = self._keyword_condition(keywords)
+                conditions.append(clause)
+                params.extend(keyword_params)
+            with self.get_cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT MIN(CAST(ROUND(odds * ?, 6) AS INTEGER), ?) AS bucket, COUNT(*)
+                    FROM suspicious_trades
+                    WHERE {' AND '.join(conditions)}
+                    GROUP BY bucket
+                """, params)
+                for bucket, count in cursor.fetchall():
+                    counts[max(bucket, 0)] += count
+            return counts
             
-            # Weekly trend
-            week_ago = (datetime.now() - timedelta(days=7)).isoformat()
-            cursor.execute("""
-                SELECT DATE(detected_at) as date, COUNT(*) as count
-                FROM suspicious_trades 
-                WHERE detected_at >= ?
-                GROUP BY DATE(detected_at)
-                ORDER BY date
-            """, (week_ago,))
-            stats["weekly_trend"] = [
-                {"date": row[0], "count": row[1]} 
-                for row in cursor.fetchall()
-            ]
-            
-            # Top wallets
-            cursor.execute("""
-                SELECT wallet_address, COUNT(*) as count, SUM(bet_size) as volume
-                FROM suspicious_trades
-                GROUP BY wallet_address
-                ORDER BY count DESC
-                LIMIT 10
-            """)
-            stats["top_wallets"] = [
-                {"wallet": row[0], "count": row[1], "volume": row[2]}
-                for row in cursor.fetchall()
-            ]
+        except Exception as e:
+            logger.error(f"Error fetching odds histogram: {e}")
+            return [0] * bins
+    
+    def get_top_wallets(self, limit: int = 10) -> List[Dict]:
+        """
+        Wallets with the most suspicious trades, aggregated in SQL; the
+        (wallet_address, bet_size) index covers the whole query.
+        """
+        try:
+            with self.get_cursor() as cursor:
+                cursor.execute("""
+                    SELECT wallet_address, COUNT(*) as count, SUM(bet_size) as volume
+                    FROM suspicious_trades
+                    GROUP BY wallet_address
+                    ORDER BY count DESC
+                    LIMIT ?
+                """, (limit,))
+                return [
+                    {"wallet": row[0], "count": row[1], "volume": row[2]}
+                    for row in cursor.fetchall()
+                ]
             
-            conn.close()
+        except Exception as e:
+            logger.error(f"Error fetching top wallets: {e}")
+            return []
+    
+    def get_dashboard_stats(self) -> Dict:
+        """Get aggregate stats for dashboard"""
+        try:
+            stats = self.get_summary_counts()
+            stats["weekly_trend"] = self.get_daily_counts(days=7)
+            stats["top_wallets"] = self.get_top_wallets(limit=10)
             return stats
             
         except Exception as e: